@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from django.db import connection
+
+
+def reserve_primary_keys(model, objs) -> None:
+    """Draw primary keys for `objs` from the table's Postgres sequence in one round-trip."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+            [model._meta.db_table, model._meta.pk.column, len(objs)],
+        )
+        for obj, (pk,) in zip(objs, cursor.fetchall()):
+            obj.pk = pk
+
+
+def copy_insert(model, objs) -> None:
+    """Insert `objs` with Postgres `COPY FROM STDIN`; primary keys are only written when already set."""
+
+    objs = list(objs)
+    if not objs:
+        return
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not field.primary_key or objs[0].pk is not None
+    ]
+    quote = connection.ops.quote_name
+    statement = "COPY {} ({}) FROM STDIN".format(
+        quote(model._meta.db_table), ", ".join(quote(field.column) for field in fields)
+    )
+    with connection.cursor() as cursor, cursor.copy(statement) as copy:
+        for obj in objs:
+            copy.write_row(
+                [field.get_db_prep_save(field.pre_save(obj, True), connection) for field in fields]
+            )
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_kitchenorderticket_kitchendisplayevent_menu_menuitem_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='inventorybalance',
+            name='api_invento_tenant__975e5d_idx',
+        ),
+    ]
@@ -815,7 +815,6 @@ class InventoryBalance(TenantOwnedModel):
     class Meta:
         unique_together = (("tenant", "variant", "warehouse"),)
         indexes = [
-            models.Index(fields=["tenant", "variant"]),
             models.Index(fields=["tenant", "warehouse"]),
         ]
 
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from datetime import timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Tuple
 
 from django.contrib.auth import authenticate
-from django.db import transaction
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Prefetch
 from django.utils import timezone
+from django.utils.functional import cached_property
+from django.utils.text import capfirst
 from django.utils.text import slugify
 from rest_framework import serializers
+from rest_framework.fields import SkipField, get_error_detail
+from rest_framework.settings import api_settings
 
+from .bulk import copy_insert
 from .models import (
     Customer,
     Invitation,
@@ -73,18 +82,82 @@ from .services.inventory import (
 from .services.purchasing import PurchasingService
 from .services.sales import SalesService
 from .services.pos import POSService
-from .tasks import send_invitation_email
+from .services.restaurant import RestaurantService
+from .tasks import dispatch_kitchen_ticket, finalize_pos_sale, post_sales_invoice, send_invitation_email
 from .tenant import activate_tenant
 
 
 logger = logging.getLogger("irshados.audit")
 
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
 
+SLUG_ALLOCATION_ATTEMPTS = 10
+LINE_BULK_BATCH_SIZE = 1000
+POS_COPY_MIN_ROWS = 500
+ORDER_LINE_UPDATE_FIELDS = ("description", "ordered_quantity", "unit_price", "tax_rate", "metadata")
+BILL_LINE_UPDATE_FIELDS = ("description", "quantity", "unit_price", "tax_rate", "metadata")
+INVOICE_LINE_UPDATE_FIELDS = BILL_LINE_UPDATE_FIELDS
+POS_ITEM_UPDATE_FIELDS = ("quantity", "unit_price", "discount", "tax_rate", "metadata")
+POS_PAYMENT_UPDATE_FIELDS = ("method", "amount", "received_at", "reference", "metadata", "status")
+RECIPE_COMPONENT_UPDATE_FIELDS = ("quantity", "uom", "notes")
+
+
+@lru_cache(maxsize=2048)
 def _normalize_slug(slug: str) -> str:
     normalized = slugify(slug)
     return normalized
 
 
+@lru_cache(maxsize=None)
+def _concrete_field_names(model) -> frozenset[str]:
+    return frozenset(
+        name for field in model._meta.concrete_fields for name in (field.name, field.attname)
+    )
+
+
+def _changed_fields(instance, validated_data) -> tuple[str, ...]:
+    """`update_fields` for `validated_data`, limited to the model's own columns."""
+
+    concrete = _concrete_field_names(type(instance))
+    return (*(name for name in validated_data if name in concrete), "updated_at")
+
+
+def _update_columns(instance, validated_data) -> None:
+    """Write `validated_data` with one UPDATE for models whose `save()` has no side effects."""
+
+    values = {name: validated_data[name] for name in _changed_fields(instance, validated_data)[:-1]}
+    values["updated_at"] = timezone.now()
+    type(instance).objects.filter(pk=instance.pk).update(**values)
+    for attr, value in values.items():
+        setattr(instance, attr, value)
+
+
+def _apply_line_diff(
+    model, *, stale, to_update, to_create, update_fields, copy_threshold=None
+) -> None:
+    stale_ids = [line.pk for line in stale]
+    if stale_ids:
+        model.objects.filter(pk__in=stale_ids).delete()
+    if to_update:
+        now = timezone.now()
+        for line in to_update:
+            line.updated_at = now
+        model.objects.bulk_update(
+            to_update, [*update_fields, "updated_at"], batch_size=LINE_BULK_BATCH_SIZE
+        )
+    if not to_create:
+        return
+    if (
+        copy_threshold is not None
+        and len(to_create) > copy_threshold
+        and connection.vendor == "postgresql"
+    ):
+        copy_insert(model, to_create)
+    else:
+        model.objects.bulk_create(to_create, batch_size=LINE_BULK_BATCH_SIZE)
+
+
 class TenantSummarySerializer(serializers.Serializer):
     tenantId = serializers.UUIDField(source="tenant.id")
     tenantSlug = serializers.CharField(source="tenant.slug")
@@ -180,6 +253,7 @@ class SignUpSerializer(serializers.Serializer):
         "tenant_not_found": "We could not find a tenant with this slug.",
         "membership_exists": "You are already a member of this tenant.",
         "role_not_found": "The requested role does not exist for this tenant.",
+        "slug_unavailable": "This tenant slug is already taken.",
     }
 
     def validate(self, attrs):
@@ -218,14 +292,19 @@ class SignUpSerializer(serializers.Serializer):
         user = User.objects.create_user(email=email, password=password, full_name=full_name)
         return user, True
 
-    def _generate_unique_slug(self, base: str) -> str:
-        base_slug = slugify(base) or "tenant"
-        slug = base_slug
-        index = 1
-        while Tenant.objects.filter(slug=slug).exists():
-            slug = f"{base_slug}-{index}"
-            index += 1
-        return slug
+    def _create_tenant(self, name: str, provided_slug: str, domain: str) -> Tenant:
+        base_slug = _normalize_slug(provided_slug or name) or "tenant"
+        attempts = 1 if provided_slug else SLUG_ALLOCATION_ATTEMPTS
+        for index in range(attempts):
+            candidate = base_slug if index == 0 else f"{base_slug}-{index}"
+            try:
+                with transaction.atomic():
+                    return Tenant.objects.create(name=name, slug=candidate, domain=domain)
+            except IntegrityError:
+                continue
+        raise serializers.ValidationError(
+            {"tenantSlug": self.error_messages["slug_unavailable"]}
+        )
 
     @transaction.atomic
     def create(self, validated_data):
@@ -250,18 +329,20 @@ class SignUpSerializer(serializers.Serializer):
             tenant.ensure_system_roles()
             with activate_tenant(tenant):
                 role = tenant.roles.get(slug="staff")
-                membership, created_membership = Membership.objects.get_or_create(
-                    tenant=tenant,
-                    user=user,
-                    defaults={"role": role, "status": Membership.Status.ACTIVE},
-                )
+                try:
+                    with transaction.atomic():
+                        membership = Membership.objects.create(
+                            tenant=tenant,
+                            user=user,
+                            role=role,
+                            status=Membership.Status.ACTIVE,
+                        )
+                    created_membership = True
+                except IntegrityError:
+                    membership = Membership.objects.get(tenant=tenant, user=user)
+                    created_membership = False
         else:
-            slug = provided_slug.strip() or self._generate_unique_slug(tenant_name)
-            tenant = Tenant.objects.create(
-                name=tenant_name,
-                slug=_normalize_slug(slug),
-                domain=tenant_domain,
-            )
+            tenant = self._create_tenant(tenant_name, provided_slug.strip(), tenant_domain)
             tenant.ensure_system_roles()
             with activate_tenant(tenant):
                 role = tenant.roles.get(slug="owner")
@@ -336,6 +417,13 @@ class SignInSerializer(serializers.Serializer):
         return {"user": validated_data["user"], "membership": validated_data["membership"]}
 
 
+def _enqueue_invitation_email(invitation_id: str, email: str) -> None:
+    try:
+        send_invitation_email.delay(invitation_id)
+    except Exception:  # pragma: no cover - broker failures
+        logger.exception("Failed to enqueue invitation email for %s", email)
+
+
 class InvitationCreateSerializer(serializers.Serializer):
     email = serializers.EmailField()
     roleSlug = serializers.CharField(source="role_slug", required=False, allow_blank=True)
@@ -389,10 +477,9 @@ class InvitationCreateSerializer(serializers.Serializer):
             invited_by=self.context.get("invited_by"),
             expires_at=expires_at,
         )
-        try:
-            send_invitation_email.delay(str(invitation.id))
-        except Exception:  # pragma: no cover - broker failures
-            logger.exception("Failed to enqueue invitation email for %s", invitation.email)
+        invitation_id = str(invitation.id)
+        email = invitation.email
+        transaction.on_commit(lambda: _enqueue_invitation_email(invitation_id, email))
         return invitation
 
 
@@ -432,26 +519,39 @@ class InvitationAcceptSerializer(serializers.Serializer):
         email = validated_data["email"].lower()
         password = validated_data["password"]
 
-        user, _ = User.objects.get_or_create(
+        user, created_user = User.objects.get_or_create(
             email=email,
             defaults={"full_name": full_name or email.split("@")[0]},
         )
+        update_fields = ["is_active"]
         if full_name and user.full_name != full_name:
             user.full_name = full_name
-        user.set_password(password)
+            update_fields.append("full_name")
+        if created_user or not user.check_password(password):
+            user.set_password(password)
+            update_fields.append("password")
         user.is_active = True
-        user.save()
+        user.save(update_fields=update_fields)
 
         tenant = invitation.tenant
         tenant.ensure_system_roles()
         with activate_tenant(tenant):
-            membership, _ = Membership.objects.update_or_create(
+            Membership.objects.bulk_create(
+                [
+                    Membership(
+                        tenant=tenant,
+                        user=user,
+                        role=invitation.role,
+                        status=Membership.Status.ACTIVE,
+                    )
+                ],
+                update_conflicts=True,
+                update_fields=["role", "status"],
+                unique_fields=["tenant", "user"],
+            )
+            membership = Membership.objects.select_related("tenant", "role").get(
                 tenant=tenant,
                 user=user,
-                defaults={
-                    "role": invitation.role,
-                    "status": Membership.Status.ACTIVE,
-                },
             )
 
         invitation.mark_accepted()
@@ -499,12 +599,51 @@ class TenantSwitchSerializer(serializers.Serializer):
         }
 
 
-class TenantOwnedSerializer(serializers.ModelSerializer):
+class ListDeferredFieldsMixin:
+    """Omit `list_deferred_fields` from list responses; the viewset defers those columns."""
+
+    list_deferred_fields: tuple[str, ...] = ()
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if getattr(self.context.get("view"), "action", None) == "list":
+            for name in self.list_deferred_fields:
+                fields.pop(name, None)
+        return fields
+
+
+class TenantScopedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Primary key field that only resolves rows owned by the serializer's tenant."""
+
+    def get_queryset(self):
+        # Fields are bound per serializer instance, so this caches for one request.
+        queryset = getattr(self, "_tenant_queryset", None)
+        if queryset is None:
+            queryset = self._tenant_queryset = self._scope_queryset(super().get_queryset())
+        return queryset
+
+    def _scope_queryset(self, queryset):
+        try:
+            queryset.model._meta.get_field("tenant")
+        except FieldDoesNotExist:
+            return queryset
+        tenant = getattr(self.root, "_tenant", None)
+        if tenant is None:
+            return queryset.none()
+        return queryset.filter(tenant=tenant)
+
+
+class TenantOwnedSerializer(ListDeferredFieldsMixin, serializers.ModelSerializer):
     """Base serializer for tenant-scoped models."""
 
+    serializer_related_field = TenantScopedPrimaryKeyRelatedField
     read_only_fields = ("id", "created_at", "updated_at")
 
-    def _get_tenant(self):
+    @cached_property
+    def _tenant(self):
+        root = self.root
+        if root is not self and isinstance(root, TenantOwnedSerializer):
+            return root._tenant
         tenant = self.context.get("tenant")
         if tenant is not None:
             return tenant
@@ -513,8 +652,33 @@ class TenantOwnedSerializer(serializers.ModelSerializer):
             return getattr(request, "tenant", None)
         return None
 
+    def _get_tenant(self):
+        return self._tenant
+
+    @cached_property
+    def _defer_posting(self) -> bool:
+        """True when the client asked (`?defer=1`) for posting to run on the task queue."""
+
+        request = self.context.get("request")
+        return request is not None and request.query_params.get("defer") in ("1", "true")
+
+    @cached_property
+    def _actor(self):
+        """The authenticated request user, or None."""
+
+        user = getattr(self.context.get("request"), "user", None)
+        return user if getattr(user, "is_authenticated", False) else None
+
+    @cached_property
+    def _writable_fields(self):
+        return [field for field in self.fields.values() if not field.read_only]
+
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
     def create(self, validated_data):
-        tenant = self._get_tenant()
+        tenant = self._tenant
         if tenant is None and "tenant" not in validated_data:
             raise serializers.ValidationError({"detail": "Tenant context missing."})
         validated_data.setdefault("tenant", tenant)
@@ -528,6 +692,111 @@ class TenantOwnedSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "updated_at")
 
 
+class FastLineItemsListSerializer(serializers.ListSerializer):
+    """Validate write-only line items in one pass and resolve related ids in bulk.
+
+    Child serializers name their foreign keys in `line_relations`, whose ids are swapped
+    for instances loaded with one tenant-scoped `in_bulk()` per model (or per queryset,
+    to pull related rows along), and in `line_relation_ids`, whose ids are only checked
+    against the tenant and kept as-is. The child's `validate_<field>()`, validators and
+    `validate()` then run per item on the resolved values.
+    """
+
+    @cached_property
+    def _child_fields(self):
+        return [field for field in self.child.fields.values() if not field.read_only]
+
+    @cached_property
+    def _child_field_hooks(self):
+        hooks = []
+        for field in self._child_fields:
+            validate_method = getattr(self.child, f"validate_{field.field_name}", None)
+            if validate_method is not None:
+                hooks.append((field, validate_method))
+        return hooks
+
+    def _run_child_hooks(self, item):
+        errors = {}
+        for field, validate_method in self._child_field_hooks:
+            if field.source not in item:
+                continue
+            try:
+                item[field.source] = validate_method(item[field.source])
+            except serializers.ValidationError as exc:
+                errors[field.field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field.field_name] = get_error_detail(exc)
+        if errors:
+            raise serializers.ValidationError(errors)
+        try:
+            self.child.run_validators(item)
+            item = self.child.validate(item)
+        except (serializers.ValidationError, DjangoValidationError) as exc:
+            raise serializers.ValidationError(detail=serializers.as_serializer_error(exc))
+        assert item is not None, ".validate() should return the validated data"
+        return item
+
+    def run_child_validation(self, data):
+        if not isinstance(data, Mapping):
+            message = self.child.error_messages["invalid"].format(datatype=type(data).__name__)
+            raise serializers.ValidationError(
+                {api_settings.NON_FIELD_ERRORS_KEY: [message]}, code="invalid"
+            )
+        validated = {}
+        errors = {}
+        for field in self._child_fields:
+            try:
+                validated[field.source] = field.run_validation(field.get_value(data))
+            except serializers.ValidationError as exc:
+                errors[field.field_name] = exc.detail
+            except SkipField:
+                pass
+        if errors:
+            raise serializers.ValidationError(errors)
+        return validated
+
+    def to_internal_value(self, data):
+        line_items = super().to_internal_value(data)
+        tenant = getattr(self.root, "_tenant", None)
+        errors = {}
+        relations = [
+            *((name, model, True) for name, model in getattr(self.child, "line_relations", {}).items()),
+            *((name, model, False) for name, model in getattr(self.child, "line_relation_ids", {}).items()),
+        ]
+        for field_name, source, bind in relations:
+            model = getattr(source, "model", source)
+            ids = {item[field_name] for item in line_items if item.get(field_name) is not None}
+            queryset = getattr(source, "objects", source).filter(tenant=tenant, pk__in=ids)
+            if not ids:
+                found = {}
+            elif bind:
+                found = queryset.in_bulk()
+            else:
+                found = dict.fromkeys(queryset.values_list("pk", flat=True))
+            for index, item in enumerate(line_items):
+                pk = item.get(field_name)
+                if pk is None:
+                    continue
+                if pk not in found:
+                    errors.setdefault(index, {})[field_name] = [
+                        f"{capfirst(model._meta.verbose_name)} {pk} does not belong to this tenant."
+                    ]
+                elif bind:
+                    item[field_name] = found[pk]
+        for index, item in enumerate(line_items):
+            if index in errors:
+                continue
+            try:
+                line_items[index] = self._run_child_hooks(item)
+            except serializers.ValidationError as exc:
+                errors[index] = exc.detail
+        if errors:
+            if not api_settings.LIST_SERIALIZER_ERRORS_AS_DICT:
+                errors = [errors.get(index, {}) for index in range(len(line_items))]
+            raise serializers.ValidationError(errors)
+        return line_items
+
+
 class UnitOfMeasureSerializer(TenantOwnedSerializer):
     base_unit_name = serializers.CharField(source="base_unit.name", read_only=True)
 
@@ -552,9 +821,6 @@ class UnitOfMeasureSerializer(TenantOwnedSerializer):
     def validate_base_unit(self, value):
         if value is None:
             return value
-        tenant = self._get_tenant()
-        if tenant is None or tenant.id != value.tenant_id:
-            raise serializers.ValidationError("Base unit must belong to the current tenant.")
         if self.instance and self.instance.pk == value.pk:
             raise serializers.ValidationError("Base unit cannot reference the unit itself.")
         return value
@@ -581,9 +847,6 @@ class ProductCategorySerializer(TenantOwnedSerializer):
     def validate_parent(self, value):
         if value is None:
             return value
-        tenant = self._get_tenant()
-        if tenant is None or tenant.id != value.tenant_id:
-            raise serializers.ValidationError("Parent category must belong to the current tenant.")
         if self.instance and self.instance.pk == value.pk:
             raise serializers.ValidationError("Category cannot be its own parent.")
         return value
@@ -640,30 +903,6 @@ class ProductSerializer(TenantOwnedSerializer):
             "default_tax_code",
         )
 
-    def validate_category(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or tenant.id != value.tenant_id:
-            raise serializers.ValidationError("Category must belong to the current tenant.")
-        return value
-
-    def validate_base_uom(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or tenant.id != value.tenant_id:
-            raise serializers.ValidationError("Base unit must belong to the current tenant.")
-        return value
-
-    def validate_default_tax(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or tenant.id != value.tenant_id:
-            raise serializers.ValidationError("Tax definition must belong to the current tenant.")
-        return value
-
 
 class ProductVariantSerializer(TenantOwnedSerializer):
     product_name = serializers.CharField(source="product.name", read_only=True)
@@ -697,15 +936,8 @@ class ProductVariantSerializer(TenantOwnedSerializer):
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
-        tenant = self._get_tenant()
-        product = attrs.get("product") or getattr(self.instance, "product", None)
-        sales_uom = attrs.get("sales_uom") or getattr(self.instance, "sales_uom", None)
-        if tenant is None:
+        if self._tenant is None:
             raise serializers.ValidationError({"detail": "Tenant context missing."})
-        if product and product.tenant_id != tenant.id:
-            raise serializers.ValidationError({"product": "Product must belong to the current tenant."})
-        if sales_uom and sales_uom.tenant_id != tenant.id:
-            raise serializers.ValidationError({"sales_uom": "Sales unit must belong to the current tenant."})
         return attrs
 
 
@@ -755,15 +987,8 @@ class PriceListItemSerializer(TenantOwnedSerializer):
 
     def validate(self, attrs):
         attrs = super().validate(attrs)
-        tenant = self._get_tenant()
-        price_list = attrs.get("price_list") or getattr(self.instance, "price_list", None)
-        variant = attrs.get("variant") or getattr(self.instance, "variant", None)
-        if tenant is None:
+        if self._tenant is None:
             raise serializers.ValidationError({"detail": "Tenant context missing."})
-        if price_list and price_list.tenant_id != tenant.id:
-            raise serializers.ValidationError({"price_list": "Price list must belong to the current tenant."})
-        if variant and variant.tenant_id != tenant.id:
-            raise serializers.ValidationError({"variant": "Variant must belong to the current tenant."})
         return attrs
 
     def create(self, validated_data):
@@ -818,12 +1043,6 @@ class WarehouseBinSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("warehouse_code",)
 
-    def validate_warehouse(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Warehouse must belong to the current tenant.")
-        return value
-
 
 class SupplierSerializer(TenantOwnedSerializer):
     class Meta(TenantOwnedSerializer.Meta):
@@ -910,7 +1129,88 @@ class InventoryBalanceSerializer(TenantOwnedSerializer):
         )
 
 
-class StockMovementLineReadSerializer(serializers.ModelSerializer):
+INVENTORY_BALANCE_VALUES = {
+    "id": "id",
+    "variant": "variant_id",
+    "variant_id": "variant_id",
+    "variant_sku": "variant__sku",
+    "variant_name": "variant__name",
+    "warehouse": "warehouse_id",
+    "warehouse_code": "warehouse__code",
+    "warehouse_name": "warehouse__name",
+    "on_hand": "on_hand",
+    "allocated": "allocated",
+    "on_order": "on_order",
+    "average_cost": "average_cost",
+    "last_movement_at": "last_movement_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+def _identity(value):
+    return value
+
+
+def serialize_value_rows(serializer_class, lookups, rows) -> list[dict]:
+    """Render `values(*lookups.values())` rows with the same shape as `serializer_class`."""
+
+    fields = serializer_class().fields
+    converters = [
+        (
+            name,
+            lookup,
+            _identity
+            if isinstance(fields[name], serializers.RelatedField)
+            else fields[name].to_representation,
+        )
+        for name, lookup in lookups.items()
+    ]
+    # A null across a relation means the relation itself is unset; DRF skips those fields.
+    return [
+        {
+            name: None if row[lookup] is None else convert(row[lookup])
+            for name, lookup, convert in converters
+            if row[lookup] is not None or "__" not in lookup
+        }
+        for row in rows
+    ]
+
+
+def serialize_nested_value_rows(serializer_class, lookups, rows, nested) -> list[dict]:
+    """Render parent `values()` rows and stitch in each nested relation from one `values()` query.
+
+    `nested` maps a field name to `(model, serializer_class, lookups, parent_lookup)`.
+    """
+
+    rows = list(rows)
+    rendered = serialize_value_rows(serializer_class, lookups, rows)
+    parent_ids = [row["id"] for row in rows]
+    for field, (model, child_serializer, child_lookups, parent_lookup) in nested.items():
+        grouped = {pk: [] for pk in parent_ids}
+        if parent_ids:
+            child_rows = list(
+                model.objects.filter(**{f"{parent_lookup}__in": parent_ids}).values(
+                    *child_lookups.values()
+                )
+            )
+            children = serialize_value_rows(child_serializer, child_lookups, child_rows)
+            for child_row, child in zip(child_rows, children):
+                grouped[child_row[parent_lookup]].append(child)
+        for row, item in zip(rows, rendered):
+            item[field] = grouped[row["id"]]
+    return rendered
+
+
+def serialize_inventory_balances(rows) -> list[dict]:
+    """Render `values()` rows with the same shape as InventoryBalanceSerializer."""
+
+    return serialize_value_rows(InventoryBalanceSerializer, INVENTORY_BALANCE_VALUES, rows)
+
+
+class StockMovementLineReadSerializer(ListDeferredFieldsMixin, serializers.ModelSerializer):
+    list_deferred_fields = ("metadata",)
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
     warehouse_code = serializers.CharField(source="warehouse.code", read_only=True)
 
@@ -931,8 +1231,10 @@ class StockMovementLineReadSerializer(serializers.ModelSerializer):
 
 
 class StockMovementLineWriteSerializer(serializers.Serializer):
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
-    warehouse = serializers.PrimaryKeyRelatedField(queryset=Warehouse.objects.all())
+    line_relations = {"variant": ProductVariant, "warehouse": Warehouse}
+
+    variant = serializers.IntegerField()
+    warehouse = serializers.IntegerField()
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_cost = serializers.DecimalField(max_digits=16, decimal_places=6, required=False, allow_null=True)
     metadata = serializers.JSONField(required=False)
@@ -940,6 +1242,9 @@ class StockMovementLineWriteSerializer(serializers.Serializer):
     reference_id = serializers.CharField(required=False, allow_blank=True, default="")
     note = serializers.CharField(required=False, allow_blank=True, default="")
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class InventoryLedgerEntrySerializer(TenantOwnedSerializer):
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
@@ -987,9 +1292,38 @@ class InventoryLedgerEntrySerializer(TenantOwnedSerializer):
         )
 
 
+INVENTORY_LEDGER_VALUES = {
+    "id": "id",
+    "movement": "movement_id",
+    "movement_type": "movement__movement_type",
+    "line": "line_id",
+    "variant": "variant_id",
+    "variant_sku": "variant__sku",
+    "warehouse": "warehouse_id",
+    "warehouse_code": "warehouse__code",
+    "quantity_delta": "quantity_delta",
+    "value_delta": "value_delta",
+    "running_quantity": "running_quantity",
+    "running_value": "running_value",
+    "average_cost": "average_cost",
+    "reference_type": "reference_type",
+    "reference_id": "reference_id",
+    "note": "note",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+
+def serialize_inventory_ledger_entries(rows) -> list[dict]:
+    """Render `values()` rows with the same shape as InventoryLedgerEntrySerializer."""
+
+    return serialize_value_rows(InventoryLedgerEntrySerializer, INVENTORY_LEDGER_VALUES, rows)
+
+
 class StockMovementSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("description", "metadata")
+
     lines = StockMovementLineReadSerializer(many=True, read_only=True)
-    ledger_entries = InventoryLedgerEntrySerializer(many=True, read_only=True)
     line_items = StockMovementLineWriteSerializer(many=True, write_only=True)
 
     class Meta(TenantOwnedSerializer.Meta):
@@ -1006,34 +1340,39 @@ class StockMovementSerializer(TenantOwnedSerializer):
             "source_document_id",
             "metadata",
             "lines",
-            "ledger_entries",
             "line_items",
             "created_at",
             "updated_at",
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + (
             "lines",
-            "ledger_entries",
             "performed_by",
             "performed_at",
         )
 
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = StockMovementLine.objects.select_related("variant", "warehouse")
+        if for_list:
+            lines = lines.defer(*StockMovementLineReadSerializer.list_deferred_fields)
+        return queryset.select_related("performed_by").prefetch_related(
+            Prefetch("lines", queryset=lines)
+        )
+
     def validate(self, attrs):
         attrs = super().validate(attrs)
         if self.instance is None and not attrs.get("line_items"):
             raise serializers.ValidationError({"line_items": "Provide at least one movement line."})
         return attrs
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items_data = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
+        tenant = self._tenant
         if tenant is None:
             raise serializers.ValidationError({"detail": "Tenant context missing."})
 
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user and not getattr(user, "is_authenticated", False):
-            user = None
+        user = self._actor
 
         lines = [
             StockMovementLineParams(
@@ -1059,15 +1398,14 @@ class StockMovementSerializer(TenantOwnedSerializer):
             source_document_type=validated_data.get("source_document_type", ""),
             source_document_id=validated_data.get("source_document_id", ""),
             metadata=validated_data.get("metadata"),
+            status=validated_data.get("status"),
         )
-        status = validated_data.get("status")
-        if status and status != movement.status:
-            movement.status = status
-            movement.save(update_fields=["status", "updated_at"])
         return movement
 
 
 class PurchaseOrderLineSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("description", "metadata")
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
     variant_name = serializers.CharField(source="variant.name", read_only=True)
 
@@ -1099,15 +1437,22 @@ class PurchaseOrderLineSerializer(TenantOwnedSerializer):
 
 
 class PurchaseOrderLineWriteSerializer(serializers.Serializer):
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
+    line_relation_ids = {"variant": ProductVariant}
+
+    variant = serializers.IntegerField()
     description = serializers.CharField(required=False, allow_blank=True, default="")
     ordered_quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, default=Decimal("0"))
     tax_rate = serializers.DecimalField(max_digits=6, decimal_places=3, required=False, default=Decimal("0"))
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class PurchaseOrderSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("notes",)
+
     supplier_name = serializers.CharField(source="supplier.name", read_only=True)
     lines = PurchaseOrderLineSerializer(many=True, read_only=True)
     line_items = PurchaseOrderLineWriteSerializer(many=True, write_only=True, required=False)
@@ -1142,23 +1487,23 @@ class PurchaseOrderSerializer(TenantOwnedSerializer):
             "supplier_name",
         )
 
-    def validate_supplier(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Supplier must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = PurchaseOrderLine.objects.select_related("variant")
+        if for_list:
+            lines = lines.defer(*PurchaseOrderLineSerializer.list_deferred_fields)
+        return queryset.select_related("supplier", "created_by").prefetch_related(
+            Prefetch("lines", queryset=lines)
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user and not getattr(user, "is_authenticated", False):
-            user = None
+        tenant = self._tenant
 
         order = PurchaseOrder.objects.create(
             tenant=tenant,
-            created_by=user,
+            created_by=self._actor,
             **validated_data,
         )
         if line_items:
@@ -1166,51 +1511,63 @@ class PurchaseOrderSerializer(TenantOwnedSerializer):
         PurchasingService._update_order_status(order)
         return order
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         line_items = validated_data.pop("line_items", None)
-        supplier = validated_data.get("supplier")
-        if supplier is not None and supplier.tenant_id != instance.tenant_id:
-            raise serializers.ValidationError({"supplier": "Supplier must belong to the current tenant."})
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance.save(update_fields=_changed_fields(instance, validated_data))
 
         if line_items is not None:
-            instance.lines.all().delete()
-            self._replace_lines(instance, line_items)
+            existing = {}
+            for line in instance.lines.order_by("pk"):
+                existing.setdefault(line.variant_id, []).append(line)
+            self._replace_lines(instance, line_items, existing=existing)
         PurchasingService._update_order_status(instance)
         return instance
 
-    def _replace_lines(self, order: PurchaseOrder, line_items):
-        subtotal = Decimal("0")
-        tax_amount = Decimal("0")
+    def _replace_lines(self, order: PurchaseOrder, line_items, *, existing=None):
+        subtotal = _ZERO
+        tax_accumulator = _ZERO
         tenant = order.tenant
+        existing = {key: list(lines) for key, lines in (existing or {}).items()}
+        to_create = []
+        to_update = []
         for item in line_items:
-            variant = item["variant"]
-            if variant.tenant_id != tenant.id:
-                raise serializers.ValidationError(
-                    {"line_items": f"Variant {variant.pk} does not belong to this tenant."}
-                )
+            variant_id = item["variant"]
             ordered_quantity = item["ordered_quantity"]
-            unit_price = item.get("unit_price") or Decimal("0")
-            tax_rate = item.get("tax_rate") or Decimal("0")
+            unit_price = item.get("unit_price") or _ZERO
+            tax_rate = item.get("tax_rate") or _ZERO
             line_total = ordered_quantity * unit_price
             subtotal += line_total
-            tax_amount += line_total * (tax_rate / Decimal("100"))
-            PurchaseOrderLine.objects.create(
-                tenant=tenant,
-                order=order,
-                variant=variant,
-                description=item.get("description", ""),
-                ordered_quantity=ordered_quantity,
-                unit_price=unit_price,
-                tax_rate=tax_rate,
-                metadata=item.get("metadata") or {},
-            )
+            tax_accumulator += line_total * tax_rate
+            values = {
+                "description": item.get("description", ""),
+                "ordered_quantity": ordered_quantity,
+                "unit_price": unit_price,
+                "tax_rate": tax_rate,
+                "metadata": item.get("metadata") or {},
+            }
+            matches = existing.get(variant_id)
+            line = matches.pop(0) if matches else None
+            if line is None:
+                to_create.append(PurchaseOrderLine(tenant=tenant, order=order, variant_id=variant_id, **values))
+            else:
+                for attr, value in values.items():
+                    setattr(line, attr, value)
+                to_update.append(line)
+        _apply_line_diff(
+            PurchaseOrderLine,
+            stale=[line for lines in existing.values() for line in lines],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=ORDER_LINE_UPDATE_FIELDS,
+        )
 
         subtotal = subtotal.quantize(DECIMAL_PRECISION_CURRENCY)
-        tax_amount = tax_amount.quantize(DECIMAL_PRECISION_CURRENCY)
+        tax_amount = (tax_accumulator / _HUNDRED).quantize(DECIMAL_PRECISION_CURRENCY)
         order.subtotal = subtotal
         order.tax_amount = tax_amount
         order.total_amount = (subtotal + tax_amount).quantize(DECIMAL_PRECISION_CURRENCY)
@@ -1218,6 +1575,8 @@ class PurchaseOrderSerializer(TenantOwnedSerializer):
 
 
 class PurchaseReceiptLineSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("metadata",)
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
 
     class Meta(TenantOwnedSerializer.Meta):
@@ -1238,16 +1597,21 @@ class PurchaseReceiptLineSerializer(TenantOwnedSerializer):
 
 
 class PurchaseReceiptLineWriteSerializer(serializers.Serializer):
-    order_line = serializers.PrimaryKeyRelatedField(
-        queryset=PurchaseOrderLine.objects.all(), required=False, allow_null=True
-    )
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
+    line_relations = {"order_line": PurchaseOrderLine, "variant": ProductVariant}
+
+    order_line = serializers.IntegerField(required=False, allow_null=True)
+    variant = serializers.IntegerField()
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_cost = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, allow_null=True)
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class PurchaseReceiptSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("notes",)
+
     order_number = serializers.CharField(source="order.number", read_only=True)
     lines = PurchaseReceiptLineSerializer(many=True, read_only=True)
     line_items = PurchaseReceiptLineWriteSerializer(many=True, write_only=True)
@@ -1278,56 +1642,49 @@ class PurchaseReceiptSerializer(TenantOwnedSerializer):
             "lines",
         )
 
-    def validate_order(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Order must belong to the current tenant.")
-        return value
-
-    def validate_warehouse(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Warehouse must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = PurchaseReceiptLine.objects.select_related("variant")
+        if for_list:
+            lines = lines.defer(*PurchaseReceiptLineSerializer.list_deferred_fields)
+        return queryset.select_related("order", "warehouse", "stock_movement").prefetch_related(
+            Prefetch("lines", queryset=lines)
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
         auto_post = validated_data.pop("auto_post", False)
-        tenant = self._get_tenant()
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user and not getattr(user, "is_authenticated", False):
-            user = None
+        tenant = self._tenant
+        user = self._actor
 
-        receipt = PurchaseReceipt.objects.create(
-            tenant=tenant,
-            received_by=user if validated_data.get("received_by") is None else validated_data.get("received_by"),
-            **validated_data,
-        )
+        if validated_data.get("received_by") is None:
+            validated_data["received_by"] = user
+        receipt = PurchaseReceipt.objects.create(tenant=tenant, **validated_data)
 
+        lines = []
         for item in line_items:
             order_line = item.get("order_line")
             variant = item["variant"]
-            if variant.tenant_id != tenant.id:
-                raise serializers.ValidationError(
-                    {"line_items": f"Variant {variant.pk} does not belong to this tenant."}
-                )
             if order_line and order_line.order_id != receipt.order_id:
                 raise serializers.ValidationError(
                     {"line_items": "Order line does not belong to the referenced purchase order."}
                 )
-            PurchaseReceiptLine.objects.create(
-                tenant=tenant,
-                receipt=receipt,
-                order_line=order_line,
-                variant=variant,
-                quantity=item["quantity"],
-                unit_cost=item.get("unit_cost") or Decimal("0"),
-                metadata=item.get("metadata") or {},
+            lines.append(
+                PurchaseReceiptLine(
+                    tenant=tenant,
+                    receipt=receipt,
+                    order_line=order_line,
+                    variant=variant,
+                    quantity=item["quantity"],
+                    unit_cost=item.get("unit_cost") or _ZERO,
+                    metadata=item.get("metadata") or {},
+                )
             )
+        PurchaseReceiptLine.objects.bulk_create(lines, batch_size=LINE_BULK_BATCH_SIZE)
 
         if auto_post or receipt.status == PurchaseReceipt.Status.POSTED:
-            PurchasingService.post_receipt(receipt, performed_by=user)
+            PurchasingService.post_receipt(receipt, performed_by=user, lines=lines)
         return receipt
 
 
@@ -1350,15 +1707,18 @@ class PurchaseBillLineSerializer(TenantOwnedSerializer):
 
 
 class PurchaseBillLineWriteSerializer(serializers.Serializer):
-    order_line = serializers.PrimaryKeyRelatedField(
-        queryset=PurchaseOrderLine.objects.all(), required=False, allow_null=True
-    )
+    line_relations = {"order_line": PurchaseOrderLine}
+
+    order_line = serializers.IntegerField(required=False, allow_null=True)
     description = serializers.CharField(required=False, allow_blank=True, default="")
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, default=Decimal("0"))
     tax_rate = serializers.DecimalField(max_digits=6, decimal_places=3, required=False, default=Decimal("0"))
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class PurchaseBillSerializer(TenantOwnedSerializer):
     order_number = serializers.CharField(source="order.number", read_only=True)
@@ -1393,51 +1753,68 @@ class PurchaseBillSerializer(TenantOwnedSerializer):
             "lines",
         )
 
-    def validate_order(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Order must belong to the current tenant.")
-        return value
-
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
+        tenant = self._tenant
         bill = PurchaseBill.objects.create(tenant=tenant, **validated_data)
         if line_items:
             self._replace_lines(bill, line_items)
         PurchasingService.post_bill(bill)
         return bill
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         line_items = validated_data.pop("line_items", None)
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance.save(update_fields=_changed_fields(instance, validated_data))
         if line_items is not None:
-            instance.lines.all().delete()
             self._replace_lines(instance, line_items)
         PurchasingService.post_bill(instance)
         return instance
 
     def _replace_lines(self, bill: PurchaseBill, line_items):
         tenant = bill.tenant
-        bill.lines.all().delete()
+        existing = {}
+        unmatched = []
+        for line in bill.lines.all():
+            if line.order_line_id is None or line.order_line_id in existing:
+                unmatched.append(line)
+            else:
+                existing[line.order_line_id] = line
+        to_create = []
+        to_update = []
         for item in line_items:
             order_line = item.get("order_line")
             if order_line and order_line.order_id != bill.order_id:
                 raise serializers.ValidationError(
                     {"line_items": "Order line does not belong to the referenced purchase order."}
                 )
-            PurchaseBillLine.objects.create(
-                tenant=tenant,
-                bill=bill,
-                order_line=order_line,
-                description=item.get("description", ""),
-                quantity=item["quantity"],
-                unit_price=item.get("unit_price") or Decimal("0"),
-                tax_rate=item.get("tax_rate") or Decimal("0"),
-                metadata=item.get("metadata") or {},
-            )
+            values = {
+                "description": item.get("description", ""),
+                "quantity": item["quantity"],
+                "unit_price": item.get("unit_price") or _ZERO,
+                "tax_rate": item.get("tax_rate") or _ZERO,
+                "metadata": item.get("metadata") or {},
+            }
+            line = existing.pop(order_line.pk, None) if order_line else None
+            if line is None:
+                to_create.append(
+                    PurchaseBillLine(tenant=tenant, bill=bill, order_line=order_line, **values)
+                )
+            else:
+                for attr, value in values.items():
+                    setattr(line, attr, value)
+                to_update.append(line)
+        _apply_line_diff(
+            PurchaseBillLine,
+            stale=[*unmatched, *existing.values()],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=BILL_LINE_UPDATE_FIELDS,
+        )
 
 
 class PurchasePaymentSerializer(TenantOwnedSerializer):
@@ -1461,27 +1838,26 @@ class PurchasePaymentSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("bill_number",)
 
-    def validate_bill(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Bill must belong to the current tenant.")
-        return value
-
+    @transaction.atomic
     def create(self, validated_data):
-        tenant = self._get_tenant()
+        tenant = self._tenant
         payment = PurchasePayment.objects.create(tenant=tenant, **validated_data)
         PurchasingService.post_payment(payment)
         return payment
 
+    @transaction.atomic
     def update(self, instance, validated_data):
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance.save(update_fields=_changed_fields(instance, validated_data))
         PurchasingService.post_payment(instance)
         return instance
 
 
 class SalesOrderLineSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("description", "metadata")
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
     variant_name = serializers.CharField(source="variant.name", read_only=True)
 
@@ -1513,15 +1889,22 @@ class SalesOrderLineSerializer(TenantOwnedSerializer):
 
 
 class SalesOrderLineWriteSerializer(serializers.Serializer):
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
+    line_relation_ids = {"variant": ProductVariant}
+
+    variant = serializers.IntegerField()
     description = serializers.CharField(required=False, allow_blank=True, default="")
     ordered_quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, default=Decimal("0"))
     tax_rate = serializers.DecimalField(max_digits=6, decimal_places=3, required=False, default=Decimal("0"))
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class SalesOrderSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("notes",)
+
     customer_name = serializers.CharField(source="customer.name", read_only=True)
     lines = SalesOrderLineSerializer(many=True, read_only=True)
     line_items = SalesOrderLineWriteSerializer(many=True, write_only=True, required=False)
@@ -1556,23 +1939,23 @@ class SalesOrderSerializer(TenantOwnedSerializer):
             "customer_name",
         )
 
-    def validate_customer(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Customer must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = SalesOrderLine.objects.select_related("variant")
+        if for_list:
+            lines = lines.defer(*SalesOrderLineSerializer.list_deferred_fields)
+        return queryset.select_related("customer", "created_by").prefetch_related(
+            Prefetch("lines", queryset=lines)
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user and not getattr(user, "is_authenticated", False):
-            user = None
+        tenant = self._tenant
 
         order = SalesOrder.objects.create(
             tenant=tenant,
-            created_by=user,
+            created_by=self._actor,
             **validated_data,
         )
         if line_items:
@@ -1580,51 +1963,63 @@ class SalesOrderSerializer(TenantOwnedSerializer):
         SalesService._update_order_status(order)
         return order
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         line_items = validated_data.pop("line_items", None)
-        customer = validated_data.get("customer")
-        if customer is not None and customer.tenant_id != instance.tenant_id:
-            raise serializers.ValidationError({"customer": "Customer must belong to the current tenant."})
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance.save(update_fields=_changed_fields(instance, validated_data))
 
         if line_items is not None:
-            instance.lines.all().delete()
-            self._replace_lines(instance, line_items)
+            existing = {}
+            for line in instance.lines.order_by("pk"):
+                existing.setdefault(line.variant_id, []).append(line)
+            self._replace_lines(instance, line_items, existing=existing)
         SalesService._update_order_status(instance)
         return instance
 
-    def _replace_lines(self, order: SalesOrder, line_items):
-        subtotal = Decimal("0")
-        tax_amount = Decimal("0")
+    def _replace_lines(self, order: SalesOrder, line_items, *, existing=None):
+        subtotal = _ZERO
+        tax_accumulator = _ZERO
         tenant = order.tenant
+        existing = {key: list(lines) for key, lines in (existing or {}).items()}
+        to_create = []
+        to_update = []
         for item in line_items:
-            variant = item["variant"]
-            if variant.tenant_id != tenant.id:
-                raise serializers.ValidationError(
-                    {"line_items": f"Variant {variant.pk} does not belong to this tenant."}
-                )
+            variant_id = item["variant"]
             ordered_quantity = item["ordered_quantity"]
-            unit_price = item.get("unit_price") or Decimal("0")
-            tax_rate = item.get("tax_rate") or Decimal("0")
+            unit_price = item.get("unit_price") or _ZERO
+            tax_rate = item.get("tax_rate") or _ZERO
             line_total = ordered_quantity * unit_price
             subtotal += line_total
-            tax_amount += line_total * (tax_rate / Decimal("100"))
-            SalesOrderLine.objects.create(
-                tenant=tenant,
-                order=order,
-                variant=variant,
-                description=item.get("description", ""),
-                ordered_quantity=ordered_quantity,
-                unit_price=unit_price,
-                tax_rate=tax_rate,
-                metadata=item.get("metadata") or {},
-            )
+            tax_accumulator += line_total * tax_rate
+            values = {
+                "description": item.get("description", ""),
+                "ordered_quantity": ordered_quantity,
+                "unit_price": unit_price,
+                "tax_rate": tax_rate,
+                "metadata": item.get("metadata") or {},
+            }
+            matches = existing.get(variant_id)
+            line = matches.pop(0) if matches else None
+            if line is None:
+                to_create.append(SalesOrderLine(tenant=tenant, order=order, variant_id=variant_id, **values))
+            else:
+                for attr, value in values.items():
+                    setattr(line, attr, value)
+                to_update.append(line)
+        _apply_line_diff(
+            SalesOrderLine,
+            stale=[line for lines in existing.values() for line in lines],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=ORDER_LINE_UPDATE_FIELDS,
+        )
 
         subtotal = subtotal.quantize(DECIMAL_PRECISION_CURRENCY)
-        tax_amount = tax_amount.quantize(DECIMAL_PRECISION_CURRENCY)
+        tax_amount = (tax_accumulator / _HUNDRED).quantize(DECIMAL_PRECISION_CURRENCY)
         order.subtotal = subtotal
         order.tax_amount = tax_amount
         order.total_amount = (subtotal + tax_amount).quantize(DECIMAL_PRECISION_CURRENCY)
@@ -1632,6 +2027,8 @@ class SalesOrderSerializer(TenantOwnedSerializer):
 
 
 class DeliveryNoteLineSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("metadata",)
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
 
     class Meta(TenantOwnedSerializer.Meta):
@@ -1652,16 +2049,21 @@ class DeliveryNoteLineSerializer(TenantOwnedSerializer):
 
 
 class DeliveryNoteLineWriteSerializer(serializers.Serializer):
-    order_line = serializers.PrimaryKeyRelatedField(
-        queryset=SalesOrderLine.objects.all(), required=False, allow_null=True
-    )
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
+    line_relations = {"order_line": SalesOrderLine, "variant": ProductVariant}
+
+    order_line = serializers.IntegerField(required=False, allow_null=True)
+    variant = serializers.IntegerField()
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, allow_null=True)
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class DeliveryNoteSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("notes",)
+
     order_number = serializers.CharField(source="order.number", read_only=True)
     lines = DeliveryNoteLineSerializer(many=True, read_only=True)
     line_items = DeliveryNoteLineWriteSerializer(many=True, write_only=True)
@@ -1688,60 +2090,54 @@ class DeliveryNoteSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("order_number", "stock_movement", "lines")
 
-    def validate_order(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Order must belong to the current tenant.")
-        return value
-
-    def validate_warehouse(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Warehouse must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = DeliveryNoteLine.objects.select_related("variant")
+        if for_list:
+            lines = lines.defer(*DeliveryNoteLineSerializer.list_deferred_fields)
+        return queryset.select_related("order", "warehouse", "stock_movement").prefetch_related(
+            Prefetch("lines", queryset=lines)
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
         auto_post = validated_data.pop("auto_post", False)
-        tenant = self._get_tenant()
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        fulfilled_by = validated_data.get("fulfilled_by") or (user if getattr(user, "is_authenticated", False) else None)
+        tenant = self._tenant
+        if validated_data.get("fulfilled_by") is None:
+            validated_data["fulfilled_by"] = self._actor
 
-        delivery = DeliveryNote.objects.create(
-            tenant=tenant,
-            fulfilled_by=fulfilled_by,
-            **validated_data,
-        )
+        delivery = DeliveryNote.objects.create(tenant=tenant, **validated_data)
 
+        lines = []
         for item in line_items:
             order_line = item.get("order_line")
             variant = item["variant"]
-            if variant.tenant_id != tenant.id:
-                raise serializers.ValidationError(
-                    {"line_items": f"Variant {variant.pk} does not belong to this tenant."}
-                )
             if order_line and order_line.order_id != delivery.order_id:
                 raise serializers.ValidationError(
                     {"line_items": "Order line does not belong to the referenced sales order."}
                 )
-            DeliveryNoteLine.objects.create(
-                tenant=tenant,
-                delivery=delivery,
-                order_line=order_line,
-                variant=variant,
-                quantity=item["quantity"],
-                unit_price=item.get("unit_price") or Decimal("0"),
-                metadata=item.get("metadata") or {},
+            lines.append(
+                DeliveryNoteLine(
+                    tenant=tenant,
+                    delivery=delivery,
+                    order_line=order_line,
+                    variant=variant,
+                    quantity=item["quantity"],
+                    unit_price=item.get("unit_price") or _ZERO,
+                    metadata=item.get("metadata") or {},
+                )
             )
+        DeliveryNoteLine.objects.bulk_create(lines, batch_size=LINE_BULK_BATCH_SIZE)
 
         if auto_post or delivery.status == DeliveryNote.Status.POSTED:
-            performer = user if getattr(user, "is_authenticated", False) else None
-            SalesService.post_delivery(delivery, performed_by=performer)
+            SalesService.post_delivery(delivery, performed_by=self._actor, lines=lines)
         return delivery
 
 
 class SalesInvoiceLineSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("metadata",)
+
     class Meta(TenantOwnedSerializer.Meta):
         model = SalesInvoiceLine
         fields = [
@@ -1760,15 +2156,18 @@ class SalesInvoiceLineSerializer(TenantOwnedSerializer):
 
 
 class SalesInvoiceLineWriteSerializer(serializers.Serializer):
-    order_line = serializers.PrimaryKeyRelatedField(
-        queryset=SalesOrderLine.objects.all(), required=False, allow_null=True
-    )
+    line_relations = {"order_line": SalesOrderLine}
+
+    order_line = serializers.IntegerField(required=False, allow_null=True)
     description = serializers.CharField(required=False, allow_blank=True, default="")
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, default=Decimal("0"))
     tax_rate = serializers.DecimalField(max_digits=6, decimal_places=3, required=False, default=Decimal("0"))
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class SalesInvoiceSerializer(TenantOwnedSerializer):
     order_number = serializers.CharField(source="order.number", read_only=True)
@@ -1803,50 +2202,117 @@ class SalesInvoiceSerializer(TenantOwnedSerializer):
             "lines",
         )
 
-    def validate_order(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Order must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        lines = SalesInvoiceLine.objects.all()
+        if for_list:
+            lines = lines.defer(*SalesInvoiceLineSerializer.list_deferred_fields)
+        return queryset.select_related("order").prefetch_related(Prefetch("lines", queryset=lines))
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
+        tenant = self._tenant
         invoice = SalesInvoice.objects.create(tenant=tenant, **validated_data)
         if line_items:
             self._replace_lines(invoice, line_items)
-        SalesService.post_invoice(invoice)
+        self._post(invoice)
         return invoice
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         line_items = validated_data.pop("line_items", None)
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
+        _update_columns(instance, validated_data)
         if line_items is not None:
-            instance.lines.all().delete()
             self._replace_lines(instance, line_items)
-        SalesService.post_invoice(instance)
+        self._post(instance)
         return instance
 
+    def _post(self, invoice: SalesInvoice) -> None:
+        if not self._defer_posting:
+            SalesService.post_invoice(invoice)
+            return
+        tenant_id, invoice_id = str(invoice.tenant_id), invoice.pk
+        transaction.on_commit(lambda: post_sales_invoice.delay(tenant_id, invoice_id))
+
     def _replace_lines(self, invoice: SalesInvoice, line_items):
         tenant = invoice.tenant
+        existing = {}
+        unmatched = []
+        for line in invoice.lines.all():
+            if line.order_line_id is None or line.order_line_id in existing:
+                unmatched.append(line)
+            else:
+                existing[line.order_line_id] = line
+        to_create = []
+        to_update = []
         for item in line_items:
             order_line = item.get("order_line")
             if order_line and order_line.order_id != invoice.order_id:
                 raise serializers.ValidationError(
                     {"line_items": "Order line does not belong to the referenced sales order."}
                 )
-            SalesInvoiceLine.objects.create(
-                tenant=tenant,
-                invoice=invoice,
-                order_line=order_line,
-                description=item.get("description", ""),
-                quantity=item["quantity"],
-                unit_price=item.get("unit_price") or Decimal("0"),
-                tax_rate=item.get("tax_rate") or Decimal("0"),
-                metadata=item.get("metadata") or {},
-            )
+            values = {
+                "description": item.get("description", ""),
+                "quantity": item["quantity"],
+                "unit_price": item.get("unit_price") or _ZERO,
+                "tax_rate": item.get("tax_rate") or _ZERO,
+                "metadata": item.get("metadata") or {},
+            }
+            line = existing.pop(order_line.pk, None) if order_line else None
+            if line is None:
+                to_create.append(
+                    SalesInvoiceLine(tenant=tenant, invoice=invoice, order_line=order_line, **values)
+                )
+            else:
+                for attr, value in values.items():
+                    setattr(line, attr, value)
+                to_update.append(line)
+        _apply_line_diff(
+            SalesInvoiceLine,
+            stale=[*unmatched, *existing.values()],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=INVOICE_LINE_UPDATE_FIELDS,
+        )
+
+
+SALES_INVOICE_VALUES = {
+    "id": "id",
+    "order": "order_id",
+    "order_number": "order__number",
+    "number": "number",
+    "status": "status",
+    "invoice_date": "invoice_date",
+    "due_date": "due_date",
+    "currency": "currency",
+    "subtotal": "subtotal",
+    "tax_amount": "tax_amount",
+    "total_amount": "total_amount",
+    "notes": "notes",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+SALES_INVOICE_NESTED_VALUES = {
+    "lines": (
+        SalesInvoiceLine,
+        SalesInvoiceLineSerializer,
+        {
+            "id": "id",
+            "invoice": "invoice_id",
+            "order_line": "order_line_id",
+            "description": "description",
+            "quantity": "quantity",
+            "unit_price": "unit_price",
+            "tax_rate": "tax_rate",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        "invoice_id",
+    ),
+}
 
 
 class SalesPaymentSerializer(TenantOwnedSerializer):
@@ -1870,22 +2336,17 @@ class SalesPaymentSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("invoice_number",)
 
-    def validate_invoice(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Invoice must belong to the current tenant.")
-        return value
-
+    @transaction.atomic
     def create(self, validated_data):
-        tenant = self._get_tenant()
+        tenant = self._tenant
         payment = SalesPayment.objects.create(tenant=tenant, **validated_data)
         SalesService.post_payment(payment)
         return payment
 
+    @transaction.atomic
     def update(self, instance, validated_data):
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
+        _update_columns(instance, validated_data)
         SalesService.post_payment(instance)
         return instance
 
@@ -1909,14 +2370,9 @@ class SalesRefundSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("invoice_number",)
 
-    def validate_invoice(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Invoice must belong to the current tenant.")
-        return value
-
+    @transaction.atomic
     def create(self, validated_data):
-        tenant = self._get_tenant()
+        tenant = self._tenant
         refund = SalesRefund.objects.create(tenant=tenant, **validated_data)
         SalesService.register_refund(refund)
         return refund
@@ -1949,12 +2405,6 @@ class MenuSectionSerializer(TenantOwnedSerializer):
             "updated_at",
         ]
 
-    def validate_menu(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Menu must belong to the current tenant.")
-        return value
-
 
 class MenuItemSerializer(TenantOwnedSerializer):
     section_name = serializers.CharField(source="section.name", read_only=True)
@@ -1977,19 +2427,22 @@ class MenuItemSerializer(TenantOwnedSerializer):
             "updated_at",
         ]
 
-    def validate_section(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Section must belong to the current tenant.")
-        return value
 
-    def validate_variant(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Variant must belong to the current tenant.")
-        return value
+MENU_ITEM_VALUES = {
+    "id": "id",
+    "section": "section_id",
+    "section_name": "section__name",
+    "name": "name",
+    "description": "description",
+    "sku": "sku",
+    "base_price": "base_price",
+    "is_active": "is_active",
+    "preparation_time_seconds": "preparation_time_seconds",
+    "variant": "variant_id",
+    "tags": "tags",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
 
 
 class MenuModifierGroupSerializer(TenantOwnedSerializer):
@@ -2007,12 +2460,6 @@ class MenuModifierGroupSerializer(TenantOwnedSerializer):
             "updated_at",
         ]
 
-    def validate_item(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Item must belong to the current tenant.")
-        return value
-
 
 class MenuModifierOptionSerializer(TenantOwnedSerializer):
     class Meta(TenantOwnedSerializer.Meta):
@@ -2029,20 +2476,6 @@ class MenuModifierOptionSerializer(TenantOwnedSerializer):
             "updated_at",
         ]
 
-    def validate_group(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Modifier group must belong to the current tenant.")
-        return value
-
-    def validate_variant(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Variant must belong to the current tenant.")
-        return value
-
 
 class RecipeComponentSerializer(TenantOwnedSerializer):
     ingredient_sku = serializers.CharField(source="ingredient.sku", read_only=True)
@@ -2064,24 +2497,6 @@ class RecipeComponentSerializer(TenantOwnedSerializer):
             "ingredient_sku",
         )
 
-    def validate_recipe(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Recipe must belong to the current tenant.")
-        return value
-
-    def validate_ingredient(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Ingredient must belong to the current tenant.")
-        return value
-
-    def validate_uom(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Unit must belong to the current tenant.")
-        return value
-
 
 class RecipeSerializer(TenantOwnedSerializer):
     components = RecipeComponentSerializer(many=True, read_only=True)
@@ -2101,47 +2516,58 @@ class RecipeSerializer(TenantOwnedSerializer):
             "updated_at",
         ]
 
-    def validate_item(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Menu item must belong to the current tenant.")
-        return value
-
-    def validate_yield_uom(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Unit must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        return queryset.prefetch_related(
+            Prefetch("components", queryset=RecipeComponent.objects.select_related("ingredient"))
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         components = validated_data.pop("component_items", [])
         recipe = super().create(validated_data)
         self._sync_components(recipe, components)
         return recipe
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         components = validated_data.pop("component_items", None)
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
         recipe = super().update(instance, validated_data)
         if components is not None:
-            recipe.components.all().delete()
-            self._sync_components(recipe, components)
+            existing = {component.ingredient_id: component for component in recipe.components.all()}
+            self._sync_components(recipe, components, existing=existing)
         return recipe
 
-    def _sync_components(self, recipe: Recipe, components: list[dict]) -> None:
-        tenant = self._get_tenant()
+    def _sync_components(self, recipe: Recipe, components: list[dict], *, existing=None) -> None:
+        tenant = self._tenant
         if tenant is None:
             tenant = recipe.tenant
+        existing = dict(existing or {})
+        to_create = []
+        to_update = []
         for payload in components:
-            RecipeComponent.objects.create(
-                tenant=tenant,
-                recipe=recipe,
-                ingredient=payload["ingredient"],
-                quantity=payload["quantity"],
-                uom=payload["uom"],
-                notes=payload.get("notes", ""),
-            )
+            values = {
+                "quantity": payload["quantity"],
+                "uom": payload["uom"],
+                "notes": payload.get("notes", ""),
+            }
+            component = existing.pop(payload["ingredient"].pk, None)
+            if component is None:
+                to_create.append(
+                    RecipeComponent(tenant=tenant, recipe=recipe, ingredient=payload["ingredient"], **values)
+                )
+            else:
+                for attr, value in values.items():
+                    setattr(component, attr, value)
+                to_update.append(component)
+        _apply_line_diff(
+            RecipeComponent,
+            stale=existing.values(),
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=RECIPE_COMPONENT_UPDATE_FIELDS,
+        )
 
 
 class KitchenOrderLineSerializer(TenantOwnedSerializer):
@@ -2167,11 +2593,16 @@ class KitchenOrderLineSerializer(TenantOwnedSerializer):
 
 
 class KitchenOrderLineWriteSerializer(serializers.Serializer):
-    item = serializers.PrimaryKeyRelatedField(queryset=MenuItem.objects.all())
+    line_relations = {"item": MenuItem.objects.select_related("section")}
+
+    item = serializers.IntegerField()
     quantity = serializers.DecimalField(max_digits=10, decimal_places=3, default=Decimal("1"))
     modifiers = serializers.JSONField(required=False)
     notes = serializers.CharField(required=False, allow_blank=True, default="")
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class KitchenDisplayEventSerializer(TenantOwnedSerializer):
     ticket_number = serializers.CharField(source="ticket.ticket_number", read_only=True)
@@ -2196,10 +2627,39 @@ class KitchenDisplayEventSerializer(TenantOwnedSerializer):
         )
 
 
+class KitchenDisplayEventSlimSerializer(TenantOwnedSerializer):
+    """Ticket-nested events without the free-form `metadata` payload."""
+
+    ticket_number = serializers.CharField(source="ticket.ticket_number", read_only=True)
+
+    class Meta(TenantOwnedSerializer.Meta):
+        model = KitchenDisplayEvent
+        fields = [
+            "id",
+            "ticket",
+            "ticket_number",
+            "action",
+            "actor",
+            "occurred_at",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
+
+
+def _kitchen_line_params(entry: dict) -> dict:
+    return {
+        "item": entry["item"],
+        "quantity": entry.get("quantity", Decimal("1")),
+        "modifiers": entry.get("modifiers", []),
+        "notes": entry.get("notes", ""),
+    }
+
+
 class KitchenOrderTicketSerializer(TenantOwnedSerializer):
     lines = KitchenOrderLineSerializer(many=True, read_only=True)
     line_items = KitchenOrderLineWriteSerializer(many=True, write_only=True)
-    events = KitchenDisplayEventSerializer(many=True, read_only=True)
+    events = KitchenDisplayEventSlimSerializer(source="kds_events", many=True, read_only=True)
 
     class Meta(TenantOwnedSerializer.Meta):
         model = KitchenOrderTicket
@@ -2224,27 +2684,81 @@ class KitchenOrderTicketSerializer(TenantOwnedSerializer):
             "completed_at",
         )
 
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        return queryset.prefetch_related(
+            Prefetch("lines", queryset=KitchenOrderLine.objects.select_related("item")),
+            Prefetch(
+                "kds_events",
+                queryset=KitchenDisplayEvent.objects.only(
+                    "id", "ticket", "action", "actor", "occurred_at", "created_at", "updated_at"
+                ),
+            ),
+        )
+
+    @transaction.atomic
     def create(self, validated_data):
         line_payload = validated_data.pop("line_items", [])
-        tenant = self._get_tenant()
+        tenant = self._tenant
         ticket = super().create(validated_data)
         RestaurantService.create_ticket(
             tenant=tenant,
             ticket=ticket,
-            lines=[
-                {
-                    "item": entry["item"],
-                    "quantity": entry.get("quantity", Decimal("1")),
-                    "modifiers": entry.get("modifiers", []),
-                    "notes": entry.get("notes", ""),
-                }
-                for entry in line_payload
-            ],
+            lines=map(_kitchen_line_params, line_payload),
         )
-        dispatch_kitchen_ticket.delay(str(ticket.id))
+        ticket_id = str(ticket.id)
+        transaction.on_commit(lambda: dispatch_kitchen_ticket.delay(ticket_id))
         return ticket
 
 
+KITCHEN_ORDER_TICKET_VALUES = {
+    "id": "id",
+    "ticket_number": "ticket_number",
+    "status": "status",
+    "source": "source",
+    "table_number": "table_number",
+    "notes": "notes",
+    "placed_at": "placed_at",
+    "completed_at": "completed_at",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+KITCHEN_ORDER_TICKET_NESTED_VALUES = {
+    "lines": (
+        KitchenOrderLine,
+        KitchenOrderLineSerializer,
+        {
+            "id": "id",
+            "ticket": "ticket_id",
+            "item": "item_id",
+            "item_name": "item__name",
+            "quantity": "quantity",
+            "modifiers": "modifiers",
+            "notes": "notes",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        "ticket_id",
+    ),
+    "events": (
+        KitchenDisplayEvent,
+        KitchenDisplayEventSlimSerializer,
+        {
+            "id": "id",
+            "ticket": "ticket_id",
+            "ticket_number": "ticket__ticket_number",
+            "action": "action",
+            "actor": "actor",
+            "occurred_at": "occurred_at",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        "ticket_id",
+    ),
+}
+
+
 class KitchenDisplayActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=KitchenDisplayEvent.Action.choices)
     actor = serializers.CharField(required=False, allow_blank=True)
@@ -2269,12 +2783,6 @@ class QROrderingTokenSerializer(TenantOwnedSerializer):
         ]
         read_only_fields = TenantOwnedSerializer.Meta.read_only_fields + ("menu_name",)
 
-    def validate_menu(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Menu must belong to the current tenant.")
-        return value
-
     def validate(self, attrs):
         attrs = super().validate(attrs)
         if attrs.get("expires_at") and attrs["expires_at"] <= timezone.now():
@@ -2311,18 +2819,16 @@ class POSShiftSerializer(TenantOwnedSerializer):
         )
 
     def create(self, validated_data):
-        tenant = self._get_tenant()
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
-        if user and not getattr(user, "is_authenticated", False):
-            user = None
+        tenant = self._tenant
         if validated_data.get("opened_by") is None:
-            validated_data["opened_by"] = user
+            validated_data["opened_by"] = self._actor
         shift = POSShift.objects.create(tenant=tenant, **validated_data)
         return shift
 
 
 class POSSaleItemSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("metadata",)
+
     variant_sku = serializers.CharField(source="variant.sku", read_only=True)
 
     class Meta(TenantOwnedSerializer.Meta):
@@ -2345,15 +2851,22 @@ class POSSaleItemSerializer(TenantOwnedSerializer):
 
 
 class POSSaleItemWriteSerializer(serializers.Serializer):
-    variant = serializers.PrimaryKeyRelatedField(queryset=ProductVariant.objects.all())
+    line_relation_ids = {"variant": ProductVariant}
+
+    variant = serializers.IntegerField()
     quantity = serializers.DecimalField(max_digits=16, decimal_places=3)
     unit_price = serializers.DecimalField(max_digits=16, decimal_places=4)
     discount = serializers.DecimalField(max_digits=16, decimal_places=4, required=False, default=Decimal("0"))
     tax_rate = serializers.DecimalField(max_digits=6, decimal_places=3, required=False, default=Decimal("0"))
     metadata = serializers.JSONField(required=False)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class POSSalePaymentSerializer(TenantOwnedSerializer):
+    list_deferred_fields = ("metadata",)
+
     class Meta(TenantOwnedSerializer.Meta):
         model = POSSalePayment
         fields = [
@@ -2379,6 +2892,9 @@ class POSSalePaymentWriteSerializer(serializers.Serializer):
     metadata = serializers.JSONField(required=False)
     status = serializers.ChoiceField(choices=POSSalePayment.Status.choices, default=POSSalePayment.Status.POSTED)
 
+    class Meta:
+        list_serializer_class = FastLineItemsListSerializer
+
 
 class POSSaleSerializer(TenantOwnedSerializer):
     shift_code = serializers.CharField(source="shift.register_code", read_only=True)
@@ -2429,99 +2945,186 @@ class POSSaleSerializer(TenantOwnedSerializer):
             "stock_movement",
         )
 
-    def validate_shift(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Shift must belong to the current tenant.")
-        return value
-
-    def validate_warehouse(self, value):
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Warehouse must belong to the current tenant.")
-        return value
-
-    def validate_customer(self, value):
-        if value is None:
-            return value
-        tenant = self._get_tenant()
-        if tenant is None or value.tenant_id != tenant.id:
-            raise serializers.ValidationError("Customer must belong to the current tenant.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset, *, for_list=False):
+        items = POSSaleItem.objects.select_related("variant")
+        payments = POSSalePayment.objects.all()
+        if for_list:
+            items = items.defer(*POSSaleItemSerializer.list_deferred_fields)
+            payments = payments.defer(*POSSalePaymentSerializer.list_deferred_fields)
+        return queryset.select_related("shift", "customer").prefetch_related(
+            Prefetch("items", queryset=items),
+            Prefetch("payments", queryset=payments),
+        )
 
+    @transaction.atomic
     def create(self, validated_data):
         line_items = validated_data.pop("line_items", [])
         payment_items = validated_data.pop("payment_items", [])
         auto_finalize = validated_data.pop("auto_finalize", False)
 
-        tenant = self._get_tenant()
+        tenant = self._tenant
         sale = POSSale.objects.create(tenant=tenant, **validated_data)
         self._replace_items(sale, line_items)
         if payment_items:
             self._replace_payments(sale, payment_items)
         POSService.recalculate_sale_totals(sale)
 
-        request = self.context.get("request")
-        performer = request.user if getattr(request, "user", None) and request.user.is_authenticated else None
         if auto_finalize or sale.status == POSSale.Status.PAID:
-            POSService.finalize_sale(sale, performed_by=performer)
+            self._finalize(sale)
         return sale
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         line_items = validated_data.pop("line_items", None)
         payment_items = validated_data.pop("payment_items", None)
         auto_finalize = validated_data.pop("auto_finalize", False)
+        instance = type(instance).objects.select_for_update().get(pk=instance.pk)
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save(update_fields=[*validated_data.keys(), "updated_at"])
+        _update_columns(instance, validated_data)
 
         if line_items is not None:
-            instance.items.all().delete()
-            self._replace_items(instance, line_items)
+            existing = {}
+            unmatched = []
+            for item in instance.items.all():
+                if item.variant_id in existing:
+                    unmatched.append(item)
+                else:
+                    existing[item.variant_id] = item
+            self._replace_items(instance, line_items, existing=existing, unmatched=unmatched)
         if payment_items is not None:
-            instance.payments.all().delete()
-            self._replace_payments(instance, payment_items)
+            self._replace_payments(instance, payment_items, existing=list(instance.payments.order_by("pk")))
 
         POSService.recalculate_sale_totals(instance)
-        request = self.context.get("request")
-        performer = request.user if getattr(request, "user", None) and request.user.is_authenticated else None
         if auto_finalize or instance.status == POSSale.Status.PAID:
-            POSService.finalize_sale(instance, performed_by=performer)
+            self._finalize(instance)
         return instance
 
-    def _replace_items(self, sale: POSSale, line_items):
+    def _finalize(self, sale: POSSale) -> None:
+        performer = self._actor
+        if not self._defer_posting:
+            POSService.finalize_sale(sale, performed_by=performer)
+            return
+        tenant_id, sale_id = str(sale.tenant_id), sale.pk
+        performer_id = str(performer.pk) if performer is not None else None
+        transaction.on_commit(lambda: finalize_pos_sale.delay(tenant_id, sale_id, performer_id))
+
+    def _replace_items(self, sale: POSSale, line_items, *, existing=None, unmatched=()):
         tenant = sale.tenant
+        existing = dict(existing or {})
+        to_create = []
+        to_update = []
         for item in line_items:
-            variant = item["variant"]
-            if variant.tenant_id != tenant.id:
-                raise serializers.ValidationError(
-                    {"line_items": f"Variant {variant.pk} does not belong to this tenant."}
-                )
-            POSSaleItem.objects.create(
-                tenant=tenant,
-                sale=sale,
-                variant=variant,
-                quantity=item["quantity"],
-                unit_price=item["unit_price"],
-                discount=item.get("discount") or Decimal("0"),
-                tax_rate=item.get("tax_rate") or Decimal("0"),
-                metadata=item.get("metadata") or {},
-            )
+            values = {
+                "quantity": item["quantity"],
+                "unit_price": item["unit_price"],
+                "discount": item.get("discount") or _ZERO,
+                "tax_rate": item.get("tax_rate") or _ZERO,
+                "metadata": item.get("metadata") or {},
+            }
+            line = existing.pop(item["variant"], None)
+            if line is None:
+                to_create.append(POSSaleItem(tenant=tenant, sale=sale, variant_id=item["variant"], **values))
+            else:
+                for attr, value in values.items():
+                    setattr(line, attr, value)
+                to_update.append(line)
+        _apply_line_diff(
+            POSSaleItem,
+            stale=[*unmatched, *existing.values()],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=POS_ITEM_UPDATE_FIELDS,
+            copy_threshold=POS_COPY_MIN_ROWS,
+        )
 
-    def _replace_payments(self, sale: POSSale, payment_items):
+    def _replace_payments(self, sale: POSSale, payment_items, *, existing=()):
         tenant = sale.tenant
-        for item in payment_items:
-            POSSalePayment.objects.create(
-                tenant=tenant,
-                sale=sale,
-                method=item["method"],
-                amount=item["amount"],
-                received_at=item.get("received_at") or sale.created_at,
-                reference=item.get("reference", ""),
-                metadata=item.get("metadata") or {},
-                status=item.get("status") or POSSalePayment.Status.POSTED,
-            )
+        to_create = []
+        to_update = []
+        for index, item in enumerate(payment_items):
+            values = {
+                "method": item["method"],
+                "amount": item["amount"],
+                "received_at": item.get("received_at") or sale.created_at,
+                "reference": item.get("reference", ""),
+                "metadata": item.get("metadata") or {},
+                "status": item.get("status") or POSSalePayment.Status.POSTED,
+            }
+            if index < len(existing):
+                payment = existing[index]
+                for attr, value in values.items():
+                    setattr(payment, attr, value)
+                to_update.append(payment)
+            else:
+                to_create.append(POSSalePayment(tenant=tenant, sale=sale, **values))
+        _apply_line_diff(
+            POSSalePayment,
+            stale=existing[len(payment_items):],
+            to_update=to_update,
+            to_create=to_create,
+            update_fields=POS_PAYMENT_UPDATE_FIELDS,
+            copy_threshold=POS_COPY_MIN_ROWS,
+        )
+
+
+POS_SALE_VALUES = {
+    "id": "id",
+    "shift": "shift_id",
+    "shift_code": "shift__register_code",
+    "warehouse": "warehouse_id",
+    "reference": "reference",
+    "status": "status",
+    "customer": "customer_id",
+    "customer_name": "customer__name",
+    "subtotal": "subtotal",
+    "tax_amount": "tax_amount",
+    "total_amount": "total_amount",
+    "paid_amount": "paid_amount",
+    "change_due": "change_due",
+    "notes": "notes",
+    "metadata": "metadata",
+    "stock_movement": "stock_movement_id",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+}
+
+POS_SALE_NESTED_VALUES = {
+    "items": (
+        POSSaleItem,
+        POSSaleItemSerializer,
+        {
+            "id": "id",
+            "sale": "sale_id",
+            "variant": "variant_id",
+            "variant_sku": "variant__sku",
+            "quantity": "quantity",
+            "unit_price": "unit_price",
+            "discount": "discount",
+            "tax_rate": "tax_rate",
+            "line_total": "line_total",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        "sale_id",
+    ),
+    "payments": (
+        POSSalePayment,
+        POSSalePaymentSerializer,
+        {
+            "id": "id",
+            "sale": "sale_id",
+            "method": "method",
+            "amount": "amount",
+            "received_at": "received_at",
+            "reference": "reference",
+            "status": "status",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        "sale_id",
+    ),
+}
 
 
 class POSReceiptSerializer(TenantOwnedSerializer):
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal, ROUND_HALF_UP
+from functools import reduce
+from operator import or_
 from typing import Iterable, Optional
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Q
 from django.utils import timezone
 
+from ..bulk import copy_insert, reserve_primary_keys
 from ..models import (
     InventoryBalance,
     InventoryLedgerEntry,
@@ -20,13 +25,20 @@ from ..models import (
 
 DECIMAL_PRECISION_QUANTITY = Decimal("0.001")
 DECIMAL_PRECISION_CURRENCY = Decimal("0.0001")
+BALANCE_BULK_BATCH_SIZE = 1000
+MOVEMENT_COPY_MIN_ROWS = 500
+_ZERO = Decimal("0")
 
 
 def _quantize(value: Decimal, *, precision: Decimal) -> Decimal:
     return value.quantize(precision, rounding=ROUND_HALF_UP)
 
 
-@dataclass(frozen=True)
+def _as_decimal(value) -> Decimal:
+    return value if isinstance(value, Decimal) else Decimal(value)
+
+
+@dataclass(frozen=True, slots=True)
 class StockMovementLineParams:
     variant: ProductVariant
     warehouse: Warehouse
@@ -38,19 +50,19 @@ class StockMovementLineParams:
     note: str = ""
 
     def normalized_quantity(self) -> Decimal:
-        return _quantize(Decimal(self.quantity), precision=DECIMAL_PRECISION_QUANTITY)
+        return _quantize(_as_decimal(self.quantity), precision=DECIMAL_PRECISION_QUANTITY)
 
     def normalized_unit_cost(self) -> Decimal:
         if self.unit_cost is None:
-            return Decimal("0")
-        return _quantize(Decimal(self.unit_cost), precision=DECIMAL_PRECISION_CURRENCY)
+            return _ZERO
+        return _quantize(_as_decimal(self.unit_cost), precision=DECIMAL_PRECISION_CURRENCY)
 
 
 class InventoryService:
     """Utility helpers for inventory movements with weighted average costing."""
 
     @staticmethod
-    @transaction.atomic
+    @transaction.atomic(savepoint=False)
     def record_movement(
         *,
         tenant: Tenant,
@@ -62,8 +74,10 @@ class InventoryService:
         source_document_type: str = "",
         source_document_id: str = "",
         metadata: Optional[dict] = None,
+        status: str | None = None,
     ) -> StockMovement:
-        movement = StockMovement.objects.create(
+        now = timezone.now()
+        movement = StockMovement(
             tenant=tenant,
             movement_type=movement_type,
             reference_number=reference_number or "",
@@ -72,35 +86,93 @@ class InventoryService:
             source_document_type=source_document_type,
             source_document_id=source_document_id,
             metadata=metadata or {},
-            performed_at=timezone.now(),
+            performed_at=now,
         )
-
-        for line_params in lines:
-            InventoryService._process_line(movement=movement, params=line_params)
+        if status:
+            movement.status = status
+        movement.save(force_insert=True)
+
+        pending = [(params, params.normalized_quantity()) for params in lines]
+        pending = [(params, quantity) for params, quantity in pending if quantity != 0]
+        balances = InventoryService._lock_balances(tenant, [params for params, _ in pending])
+        movement_lines: list[StockMovementLine] = []
+        ledger_entries: list[InventoryLedgerEntry] = []
+        for line_params, quantity_delta in pending:
+            line, entry = InventoryService._process_line(
+                movement=movement,
+                params=line_params,
+                quantity_delta=quantity_delta,
+                balances=balances,
+                now=now,
+            )
+            movement_lines.append(line)
+            ledger_entries.append(entry)
+
+        if len(movement_lines) > MOVEMENT_COPY_MIN_ROWS and connection.vendor == "postgresql":
+            reserve_primary_keys(StockMovementLine, movement_lines)
+            copy_insert(StockMovementLine, movement_lines)
+            for line, entry in zip(movement_lines, ledger_entries):
+                entry.line = line
+            copy_insert(InventoryLedgerEntry, ledger_entries)
+        else:
+            StockMovementLine.objects.bulk_create(movement_lines)
+            for line, entry in zip(movement_lines, ledger_entries):
+                entry.line = line
+            InventoryLedgerEntry.objects.bulk_create(ledger_entries)
+        if balances:
+            InventoryBalance.objects.bulk_update(
+                balances.values(),
+                ["on_hand", "average_cost", "last_movement_at", "updated_at"],
+                batch_size=BALANCE_BULK_BATCH_SIZE,
+            )
 
         return movement
 
     @staticmethod
-    def _process_line(*, movement: StockMovement, params: StockMovementLineParams) -> None:
-        tenant = movement.tenant
-        variant = params.variant
-        warehouse = params.warehouse
-        quantity_delta = params.normalized_quantity()
-
-        balance, _ = (
+    def _lock_balances(
+        tenant: Tenant, lines: list[StockMovementLineParams]
+    ) -> dict[tuple[int, int], InventoryBalance]:
+        """Create any missing balances, then lock every balance the movement touches in one query."""
+
+        pairs = sorted({(params.variant.pk, params.warehouse.pk) for params in lines})
+        if not pairs:
+            return {}
+        InventoryBalance.objects.bulk_create(
+            [
+                InventoryBalance(tenant=tenant, variant_id=variant_id, warehouse_id=warehouse_id)
+                for variant_id, warehouse_id in pairs
+            ],
+            ignore_conflicts=True,
+        )
+        locked = (
             InventoryBalance.objects.select_for_update()
-            .get_or_create(
+            .filter(
+                reduce(
+                    or_,
+                    (Q(variant_id=variant_id, warehouse_id=warehouse_id) for variant_id, warehouse_id in pairs),
+                ),
                 tenant=tenant,
-                variant=variant,
-                warehouse=warehouse,
-                defaults={
-                    "on_hand": Decimal("0"),
-                    "allocated": Decimal("0"),
-                    "on_order": Decimal("0"),
-                    "average_cost": Decimal("0"),
-                },
             )
+            .order_by("variant_id", "warehouse_id")
         )
+        return {(balance.variant_id, balance.warehouse_id): balance for balance in locked}
+
+    @staticmethod
+    def _process_line(
+        *,
+        movement: StockMovement,
+        params: StockMovementLineParams,
+        quantity_delta: Decimal,
+        balances: dict[tuple[int, int], InventoryBalance],
+        now: datetime,
+    ) -> tuple[StockMovementLine, InventoryLedgerEntry]:
+        """Apply one line to its locked balance and return the unsaved line and ledger entry."""
+
+        tenant = movement.tenant
+        variant = params.variant
+        warehouse = params.warehouse
+
+        balance = balances[(variant.pk, warehouse.pk)]
 
         previous_quantity = balance.on_hand
         previous_avg_cost = balance.average_cost
@@ -117,17 +189,17 @@ class InventoryService:
         new_value = _quantize(new_value, precision=DECIMAL_PRECISION_CURRENCY)
 
         if new_quantity == 0:
-            average_cost = Decimal("0")
-            new_value = Decimal("0")
+            average_cost = _ZERO
+            new_value = _ZERO
         else:
             average_cost = _quantize(new_value / new_quantity, precision=DECIMAL_PRECISION_CURRENCY)
 
         balance.on_hand = _quantize(new_quantity, precision=DECIMAL_PRECISION_QUANTITY)
         balance.average_cost = average_cost
-        balance.last_movement_at = movement.performed_at
-        balance.save(update_fields=["on_hand", "average_cost", "last_movement_at", "updated_at"])
+        balance.last_movement_at = now
+        balance.updated_at = now
 
-        line = StockMovementLine.objects.create(
+        line = StockMovementLine(
             tenant=tenant,
             movement=movement,
             variant=variant,
@@ -137,11 +209,9 @@ class InventoryService:
             value_delta=value_delta,
             metadata=params.metadata or {},
         )
-
-        InventoryLedgerEntry.objects.create(
+        entry = InventoryLedgerEntry(
             tenant=tenant,
             movement=movement,
-            line=line,
             variant=variant,
             warehouse=warehouse,
             quantity_delta=quantity_delta,
@@ -153,3 +223,4 @@ class InventoryService:
             reference_id=params.reference_id,
             note=params.note,
         )
+        return line, entry
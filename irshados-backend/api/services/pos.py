@@ -3,6 +3,8 @@ from __future__ import annotations
 from decimal import Decimal
 
 from django.db import transaction
+from django.db.models import DecimalField, ExpressionWrapper, F, Sum
+from django.utils import timezone
 
 from ..models import (
     POSOfflineQueueItem,
@@ -15,6 +17,11 @@ from ..models import (
 from .inventory import InventoryService, StockMovementLineParams, DECIMAL_PRECISION_CURRENCY
 
 
+_ZERO = Decimal("0")
+_NEG_ONE = Decimal("-1")
+_HUNDRED = Decimal("100")
+
+
 def _quantize_currency(value: Decimal) -> Decimal:
     return value.quantize(DECIMAL_PRECISION_CURRENCY)
 
@@ -23,26 +30,29 @@ class POSService:
     """Helper utilities for POS register operations."""
 
     @staticmethod
-    @transaction.atomic
+    @transaction.atomic(savepoint=False)
     def recalculate_sale_totals(sale: POSSale) -> POSSale:
-        items = sale.items.all()
-        subtotal = Decimal("0")
-        tax_amount = Decimal("0")
-        for item in items:
-            line_total = item.quantity * item.unit_price - item.discount
-            subtotal += line_total
-            tax_amount += line_total * (item.tax_rate / Decimal("100"))
-            item.line_total = _quantize_currency(line_total)
-            item.save(update_fields=["line_total", "updated_at"])
-
-        subtotal = _quantize_currency(subtotal)
-        tax_amount = _quantize_currency(tax_amount)
+        line_total = ExpressionWrapper(
+            F("quantity") * F("unit_price") - F("discount"),
+            output_field=DecimalField(max_digits=16, decimal_places=4),
+        )
+        items = sale.items.order_by()
+        items.update(line_total=line_total, updated_at=timezone.now())
+        totals = items.aggregate(
+            subtotal=Sum(line_total),
+            tax=Sum(
+                line_total * F("tax_rate"),
+                output_field=DecimalField(max_digits=24, decimal_places=10),
+            ),
+        )
+        paid = sale.payments.filter(status=POSSalePayment.Status.POSTED).aggregate(total=Sum("amount"))
+
+        subtotal = _quantize_currency(totals["subtotal"] or _ZERO)
+        tax_amount = _quantize_currency((totals["tax"] or _ZERO) / _HUNDRED)
         sale.subtotal = subtotal
         sale.tax_amount = tax_amount
         sale.total_amount = _quantize_currency(subtotal + tax_amount)
-        sale.paid_amount = _quantize_currency(
-            sum(payment.amount for payment in sale.payments.filter(status=POSSalePayment.Status.POSTED))
-        )
+        sale.paid_amount = _quantize_currency(paid["total"] or _ZERO)
         sale.change_due = _quantize_currency(sale.paid_amount - sale.total_amount)
         sale.save(
             update_fields=[
@@ -72,7 +82,7 @@ class POSService:
             StockMovementLineParams(
                 variant=item.variant,
                 warehouse=sale.warehouse,
-                quantity=item.quantity * Decimal("-1"),
+                quantity=item.quantity * _NEG_ONE,
                 unit_cost=None,
                 metadata=item.metadata,
                 reference_type="pos_sale",
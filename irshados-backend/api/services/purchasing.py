@@ -1,9 +1,21 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Iterable
 
 from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.utils import timezone
 
 from ..models import (
     PurchaseBill,
@@ -18,6 +30,11 @@ from ..models import (
 from .inventory import InventoryService, StockMovementLineParams, DECIMAL_PRECISION_CURRENCY
 
 
+_AMOUNT_FIELD = DecimalField(max_digits=28, decimal_places=10)
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
+
 def _quantize_currency(value: Decimal) -> Decimal:
     return value.quantize(DECIMAL_PRECISION_CURRENCY)
 
@@ -27,25 +44,41 @@ class PurchasingService:
 
     @staticmethod
     @transaction.atomic
-    def post_receipt(receipt: PurchaseReceipt, *, performed_by=None) -> PurchaseReceipt:
+    def post_receipt(
+        receipt: PurchaseReceipt,
+        *,
+        performed_by=None,
+        lines: list[PurchaseReceiptLine] | None = None,
+    ) -> PurchaseReceipt:
         if receipt.status == PurchaseReceipt.Status.POSTED:
             return receipt
 
-        receipt_lines = list(
-            receipt.lines.select_related("order_line", "variant").all()
-        )  # evaluate once
+        if lines is None:
+            receipt_lines = list(
+                receipt.lines.select_related("order_line", "variant").only(
+                    "id",
+                    "quantity",
+                    "unit_cost",
+                    "metadata",
+                    "order_line__id",
+                    "order_line__unit_price",
+                    "variant__id",
+                )
+            )
+        else:
+            receipt_lines = list(lines)
         if not receipt_lines:
             raise ValueError("Purchase receipt must contain at least one line before posting.")
 
         order = receipt.order
         tenant = receipt.tenant
-        lines: list[StockMovementLineParams] = []
+        movement_lines: list[StockMovementLineParams] = []
 
         for line in receipt_lines:
             order_line: PurchaseOrderLine | None = line.order_line
-            base_cost = order_line.unit_price if order_line else Decimal("0")
+            base_cost = order_line.unit_price if order_line else _ZERO
             unit_cost = line.unit_cost or base_cost
-            lines.append(
+            movement_lines.append(
                 StockMovementLineParams(
                     variant=line.variant,
                     warehouse=receipt.warehouse,
@@ -61,7 +94,7 @@ class PurchasingService:
         movement = InventoryService.record_movement(
             tenant=tenant,
             movement_type=StockMovement.MovementType.PURCHASE_RECEIPT,
-            lines=lines,
+            lines=movement_lines,
             reference_number=receipt.number,
             description=f"Receipt for purchase order {order.number}",
             performed_by=performed_by,
@@ -70,11 +103,21 @@ class PurchasingService:
             metadata=receipt.notes and {"notes": receipt.notes} or {},
         )
 
+        posted_quantity: dict[int, Decimal] = {}
         for line in receipt_lines:
             if line.order_line_id:
-                order_line = line.order_line
-                order_line.received_quantity = order_line.received_quantity + line.quantity
-                order_line.save(update_fields=["received_quantity", "updated_at"])
+                posted_quantity[line.order_line_id] = (
+                    posted_quantity.get(line.order_line_id, _ZERO) + line.quantity
+                )
+        if posted_quantity:
+            PurchaseOrderLine.objects.filter(pk__in=posted_quantity).update(
+                received_quantity=F("received_quantity")
+                + Case(
+                    *(When(pk=pk, then=Value(quantity)) for pk, quantity in posted_quantity.items()),
+                    output_field=_AMOUNT_FIELD,
+                ),
+                updated_at=timezone.now(),
+            )
 
         receipt.stock_movement = movement
         receipt.status = PurchaseReceipt.Status.POSTED
@@ -89,23 +132,29 @@ class PurchasingService:
         if bill.status == PurchaseBill.Status.POSTED:
             return bill
 
-        lines = list(bill.lines.select_related("order_line").all())
-        if not lines:
+        lines = bill.lines.order_by()
+        line_total = ExpressionWrapper(F("quantity") * F("unit_price"), output_field=_AMOUNT_FIELD)
+        totals = lines.aggregate(
+            count=Count("pk"),
+            subtotal=Sum(line_total),
+            tax=Sum(line_total * F("tax_rate"), output_field=_AMOUNT_FIELD),
+        )
+        if not totals["count"]:
             raise ValueError("Purchase bill must contain at least one line before posting.")
 
-        subtotal = Decimal("0")
-        tax_amount = Decimal("0")
-        for line in lines:
-            line_total = line.quantity * line.unit_price
-            subtotal += line_total
-            tax_amount += line_total * (line.tax_rate / Decimal("100"))
-            if line.order_line_id:
-                order_line = line.order_line
-                order_line.billed_quantity = order_line.billed_quantity + line.quantity
-                order_line.save(update_fields=["billed_quantity", "updated_at"])
+        posted_quantity = (
+            lines.filter(order_line=OuterRef("pk"))
+            .values("order_line")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        PurchaseOrderLine.objects.filter(pk__in=lines.values("order_line")).update(
+            billed_quantity=F("billed_quantity") + Subquery(posted_quantity),
+            updated_at=timezone.now(),
+        )
 
-        subtotal = _quantize_currency(subtotal)
-        tax_amount = _quantize_currency(tax_amount)
+        subtotal = _quantize_currency(totals["subtotal"])
+        tax_amount = _quantize_currency(totals["tax"] / _HUNDRED)
         bill.subtotal = subtotal
         bill.tax_amount = tax_amount
         bill.total_amount = _quantize_currency(subtotal + tax_amount)
@@ -122,14 +171,10 @@ class PurchasingService:
             return payment
 
         bill = payment.bill
-        total_paid = sum(
-            (
-                posted.amount
-                for posted in bill.payments.filter(status=PurchasePayment.Status.POSTED).only("amount")
-            ),
-            start=Decimal("0"),
-        )
-        total_paid = _quantize_currency(total_paid)
+        total_paid = bill.payments.filter(status=PurchasePayment.Status.POSTED).aggregate(
+            total=Sum("amount")
+        )["total"]
+        total_paid = _quantize_currency(total_paid or _ZERO)
 
         if total_paid >= bill.total_amount:
             bill.status = PurchaseBill.Status.PAID
@@ -139,16 +184,14 @@ class PurchasingService:
 
     @staticmethod
     def _update_order_status(order: PurchaseOrder) -> None:
-        lines: Iterable[PurchaseOrderLine] = order.lines.only(
-            "ordered_quantity", "received_quantity", "billed_quantity"
+        totals = order.lines.order_by().aggregate(
+            ordered=Sum("ordered_quantity"),
+            received=Sum("received_quantity"),
+            billed=Sum("billed_quantity"),
         )
-        total_ordered = Decimal("0")
-        total_received = Decimal("0")
-        total_billed = Decimal("0")
-        for line in lines:
-            total_ordered += line.ordered_quantity
-            total_received += line.received_quantity
-            total_billed += line.billed_quantity
+        total_ordered = totals["ordered"] or _ZERO
+        total_received = totals["received"] or _ZERO
+        total_billed = totals["billed"] or _ZERO
 
         previous_status = order.status
         if total_ordered == 0:
@@ -165,4 +208,7 @@ class PurchasingService:
             order.status = PurchaseOrder.Status.SUBMITTED
 
         if order.status != previous_status:
-            order.save(update_fields=["status", "updated_at"])
+            order.updated_at = timezone.now()
+            PurchaseOrder.objects.filter(pk=order.pk).exclude(status=order.status).update(
+                status=order.status, updated_at=order.updated_at
+            )
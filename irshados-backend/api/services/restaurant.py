@@ -4,6 +4,7 @@ from decimal import Decimal
 from typing import Iterable
 
 from django.db import transaction
+from django.db.models import Prefetch
 from django.utils import timezone
 
 from ..models import (
@@ -14,6 +15,7 @@ from ..models import (
     MenuModifierOption,
     MenuModifierGroup,
     QROrderingToken,
+    Recipe,
     RecipeComponent,
     StockMovement,
     Tenant,
@@ -22,6 +24,9 @@ from ..models import (
 from .inventory import InventoryService, StockMovementLineParams
 
 
+_NEG_ONE = Decimal("-1")
+
+
 class RestaurantService:
     """Utility helpers for restaurant operations."""
 
@@ -34,21 +39,44 @@ class RestaurantService:
         lines: Iterable[dict],
         performed_by=None,
     ) -> KitchenOrderTicket:
-        created_lines: list[KitchenOrderLine] = []
+        lines = list(lines)
+        recipes = RestaurantService._recipes_by_item(tenant, [line["item"].pk for line in lines])
+        warehouse = RestaurantService._resolve_warehouse(tenant) if recipes else None
+        kot_lines: list[KitchenOrderLine] = []
+        consume_lines: list[StockMovementLineParams] = []
         for line in lines:
             item: MenuItem = line["item"]
             quantity: Decimal = Decimal(line.get("quantity", 1))
             modifiers = line.get("modifiers", [])
-            kot_line = KitchenOrderLine.objects.create(
+            kot_lines.append(
+                KitchenOrderLine(
+                    tenant=tenant,
+                    ticket=ticket,
+                    item=item,
+                    quantity=quantity,
+                    modifiers=modifiers,
+                    notes=line.get("notes", ""),
+                )
+            )
+            consume_lines.extend(
+                RestaurantService._recipe_consumption(
+                    item=item,
+                    recipe=recipes.get(item.pk),
+                    warehouse=warehouse,
+                    quantity=quantity,
+                )
+            )
+        KitchenOrderLine.objects.bulk_create(kot_lines)
+        if consume_lines:
+            InventoryService.record_movement(
                 tenant=tenant,
-                ticket=ticket,
-                item=item,
-                quantity=quantity,
-                modifiers=modifiers,
-                notes=line.get("notes", ""),
+                movement_type=StockMovement.MovementType.SALE_SHIPMENT,
+                lines=consume_lines,
+                reference_number=f"KOT-{ticket.id}",
+                description=f"Recipe consumption for ticket {ticket.ticket_number}",
+                source_document_type="kitchen_order_ticket",
+                source_document_id=str(ticket.id),
             )
-            created_lines.append(kot_line)
-            RestaurantService._consume_recipe(tenant=tenant, item=item, quantity=quantity)
 
         if performed_by:
             KitchenDisplayEvent.objects.create(
@@ -61,39 +89,36 @@ class RestaurantService:
         return ticket
 
     @staticmethod
-    def _consume_recipe(*, tenant: Tenant, item: MenuItem, quantity: Decimal) -> None:
-        recipe = getattr(item, "recipe", None)
-        if recipe is None:
-            return
+    def _recipes_by_item(tenant: Tenant, item_ids: list) -> dict:
+        recipes = Recipe.objects.filter(tenant=tenant, item_id__in=set(item_ids)).prefetch_related(
+            Prefetch("components", queryset=RecipeComponent.objects.select_related("ingredient", "uom"))
+        )
+        return {recipe.item_id: recipe for recipe in recipes}
+
+    @staticmethod
+    def _recipe_consumption(
+        *, item: MenuItem, recipe: Recipe | None, warehouse: Warehouse | None, quantity: Decimal
+    ) -> list[StockMovementLineParams]:
+        if recipe is None or warehouse is None:
+            return []
         if recipe.yield_quantity == 0:
             yield_qty = Decimal("1")
         else:
             yield_qty = recipe.yield_quantity
         factor = quantity / yield_qty
         lines: list[StockMovementLineParams] = []
-        components = recipe.components.select_related("ingredient", "uom")
-        warehouse = RestaurantService._resolve_warehouse(tenant)
-        for component in components:
+        for component in recipe.components.all():
             consume_qty = Decimal(component.quantity) * factor
             lines.append(
                 StockMovementLineParams(
                     variant=component.ingredient,
                     warehouse=warehouse,
-                    quantity=consume_qty * Decimal("-1"),
+                    quantity=consume_qty * _NEG_ONE,
                     unit_cost=None,
-                    metadata={"recipe": recipe.item.name},
+                    metadata={"recipe": item.name},
                 )
             )
-        valid_lines = [params for params in lines if params.warehouse is not None]
-        if not valid_lines:
-            return
-        InventoryService.record_movement(
-            tenant=tenant,
-            movement_type=StockMovement.MovementType.SALE_SHIPMENT,
-            lines=valid_lines,
-            reference_number=f"RECIPE-{ticket_reference()}",
-            description=f"Recipe consumption for {item.name}",
-        )
+        return lines
 
     @staticmethod
     def publish_kds_event(*, tenant: Tenant, ticket: KitchenOrderTicket, action: str, actor: str = "") -> KitchenDisplayEvent:
@@ -115,16 +140,4 @@ class RestaurantService:
 
     @staticmethod
     def _resolve_warehouse(tenant: Tenant):
-        warehouse = Warehouse.objects.filter(tenant=tenant, is_default=True).first()
-        if warehouse is None:
-            warehouse = Warehouse.objects.filter(tenant=tenant).first()
-        return warehouse
-
-
-def ticket_reference() -> str:
-    return timezone.now().strftime("%Y%m%d%H%M%S%f")
-
-
-
-
-
+        return Warehouse.objects.filter(tenant=tenant).order_by("-is_default", "name").first()
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Iterable
 
 from django.db import transaction
+from django.db.models import (
+    Case,
+    Count,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.utils import timezone
 
 from ..models import (
     DeliveryNote,
@@ -19,6 +31,12 @@ from ..models import (
 from .inventory import InventoryService, StockMovementLineParams, DECIMAL_PRECISION_CURRENCY
 
 
+_AMOUNT_FIELD = DecimalField(max_digits=28, decimal_places=10)
+_ZERO = Decimal("0")
+_NEG_ONE = Decimal("-1")
+_HUNDRED = Decimal("100")
+
+
 def _quantize_currency(value: Decimal) -> Decimal:
     return value.quantize(DECIMAL_PRECISION_CURRENCY)
 
@@ -28,11 +46,23 @@ class SalesService:
 
     @staticmethod
     @transaction.atomic
-    def post_delivery(delivery: DeliveryNote, *, performed_by=None) -> DeliveryNote:
+    def post_delivery(
+        delivery: DeliveryNote,
+        *,
+        performed_by=None,
+        lines: list[DeliveryNoteLine] | None = None,
+    ) -> DeliveryNote:
         if delivery.status == DeliveryNote.Status.POSTED:
             return delivery
 
-        lines = list(delivery.lines.select_related("order_line", "variant").all())
+        if lines is None:
+            lines = list(
+                delivery.lines.select_related("variant").only(
+                    "id", "quantity", "metadata", "order_line_id", "variant__id"
+                )
+            )
+        else:
+            lines = list(lines)
         if not lines:
             raise ValueError("Delivery note must contain at least one line before posting.")
 
@@ -45,7 +75,7 @@ class SalesService:
                 StockMovementLineParams(
                     variant=line.variant,
                     warehouse=delivery.warehouse,
-                    quantity=line.quantity * Decimal("-1"),
+                    quantity=line.quantity * _NEG_ONE,
                     metadata=line.metadata,
                     reference_type="sales_order",
                     reference_id=str(order.id),
@@ -65,11 +95,21 @@ class SalesService:
             metadata=delivery.notes and {"notes": delivery.notes} or {},
         )
 
+        posted_quantity: dict[int, Decimal] = {}
         for line in lines:
             if line.order_line_id:
-                order_line = line.order_line
-                order_line.delivered_quantity = order_line.delivered_quantity + line.quantity
-                order_line.save(update_fields=["delivered_quantity", "updated_at"])
+                posted_quantity[line.order_line_id] = (
+                    posted_quantity.get(line.order_line_id, _ZERO) + line.quantity
+                )
+        if posted_quantity:
+            SalesOrderLine.objects.filter(pk__in=posted_quantity).update(
+                delivered_quantity=F("delivered_quantity")
+                + Case(
+                    *(When(pk=pk, then=Value(quantity)) for pk, quantity in posted_quantity.items()),
+                    output_field=_AMOUNT_FIELD,
+                ),
+                updated_at=timezone.now(),
+            )
 
         delivery.stock_movement = movement
         delivery.status = DeliveryNote.Status.POSTED
@@ -84,23 +124,29 @@ class SalesService:
         if invoice.status == SalesInvoice.Status.POSTED:
             return invoice
 
-        lines = list(invoice.lines.select_related("order_line").all())
-        if not lines:
+        lines = invoice.lines.order_by()
+        line_total = ExpressionWrapper(F("quantity") * F("unit_price"), output_field=_AMOUNT_FIELD)
+        totals = lines.aggregate(
+            count=Count("pk"),
+            subtotal=Sum(line_total),
+            tax=Sum(line_total * F("tax_rate"), output_field=_AMOUNT_FIELD),
+        )
+        if not totals["count"]:
             raise ValueError("Sales invoice must contain at least one line before posting.")
 
-        subtotal = Decimal("0")
-        tax_amount = Decimal("0")
-        for line in lines:
-            line_total = line.quantity * line.unit_price
-            subtotal += line_total
-            tax_amount += line_total * (line.tax_rate / Decimal("100"))
-            if line.order_line_id:
-                order_line = line.order_line
-                order_line.invoiced_quantity = order_line.invoiced_quantity + line.quantity
-                order_line.save(update_fields=["invoiced_quantity", "updated_at"])
+        posted_quantity = (
+            lines.filter(order_line=OuterRef("pk"))
+            .values("order_line")
+            .annotate(total=Sum("quantity"))
+            .values("total")
+        )
+        SalesOrderLine.objects.filter(pk__in=lines.values("order_line")).update(
+            invoiced_quantity=F("invoiced_quantity") + Subquery(posted_quantity),
+            updated_at=timezone.now(),
+        )
 
-        subtotal = _quantize_currency(subtotal)
-        tax_amount = _quantize_currency(tax_amount)
+        subtotal = _quantize_currency(totals["subtotal"])
+        tax_amount = _quantize_currency(totals["tax"] / _HUNDRED)
         invoice.subtotal = subtotal
         invoice.tax_amount = tax_amount
         invoice.total_amount = _quantize_currency(subtotal + tax_amount)
@@ -116,14 +162,10 @@ class SalesService:
         if payment.status == SalesPayment.Status.VOID:
             return payment
         invoice = payment.invoice
-        total_paid = sum(
-            (
-                posted.amount
-                for posted in invoice.payments.filter(status=SalesPayment.Status.POSTED).only("amount")
-            ),
-            start=Decimal("0"),
-        )
-        total_paid = _quantize_currency(total_paid)
+        total_paid = invoice.payments.filter(status=SalesPayment.Status.POSTED).aggregate(
+            total=Sum("amount")
+        )["total"]
+        total_paid = _quantize_currency(total_paid or _ZERO)
         if total_paid >= invoice.total_amount:
             invoice.status = SalesInvoice.Status.PAID
             invoice.save(update_fields=["status", "updated_at"])
@@ -140,16 +182,14 @@ class SalesService:
 
     @staticmethod
     def _update_order_status(order: SalesOrder) -> None:
-        lines: Iterable[SalesOrderLine] = order.lines.only(
-            "ordered_quantity", "delivered_quantity", "invoiced_quantity"
+        totals = order.lines.order_by().aggregate(
+            ordered=Sum("ordered_quantity"),
+            delivered=Sum("delivered_quantity"),
+            invoiced=Sum("invoiced_quantity"),
         )
-        total_ordered = Decimal("0")
-        total_delivered = Decimal("0")
-        total_invoiced = Decimal("0")
-        for line in lines:
-            total_ordered += line.ordered_quantity
-            total_delivered += line.delivered_quantity
-            total_invoiced += line.invoiced_quantity
+        total_ordered = totals["ordered"] or _ZERO
+        total_delivered = totals["delivered"] or _ZERO
+        total_invoiced = totals["invoiced"] or _ZERO
 
         previous_status = order.status
         if total_ordered == 0:
@@ -166,4 +206,7 @@ class SalesService:
             order.status = SalesOrder.Status.CONFIRMED
 
         if order.status != previous_status:
-            order.save(update_fields=["status", "updated_at"])
+            order.updated_at = timezone.now()
+            SalesOrder.objects.filter(pk=order.pk).exclude(status=order.status).update(
+                status=order.status, updated_at=order.updated_at
+            )
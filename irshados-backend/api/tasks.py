@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from decimal import Decimal
-
 import logging
+import time
 from datetime import timedelta
+from functools import lru_cache
 
 from celery import shared_task
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db.models import Count, DecimalField, F, Sum
 from django.utils import timezone
 
 from .models import (
@@ -15,20 +16,43 @@ from .models import (
     Invitation,
     KitchenOrderTicket,
     MenuItem,
+    POSSale,
     RecipeComponent,
+    SalesInvoice,
     Tenant,
+    User,
 )
+from .services.pos import POSService
+from .services.sales import SalesService
+from .tenant import activate_tenant
 
 logger = logging.getLogger("irshados.audit")
 
+RECIPE_COST_CHUNK_SIZE = 2000
+TENANT_SLUG_CACHE_SECONDS = 60
+
+
+@lru_cache(maxsize=256)
+def _cached_tenant_slug(tenant_id: str, bucket: int) -> str | None:
+    return Tenant.objects.filter(id=tenant_id).values_list("slug", flat=True).first()
+
+
+def _tenant_slug(tenant_id: str) -> str | None:
+    """Tenant slug for task logging, cached per worker process for up to a minute."""
+
+    return _cached_tenant_slug(str(tenant_id), int(time.monotonic() // TENANT_SLUG_CACHE_SECONDS))
+
 
-@shared_task(name="api.send_invitation_email")
+@shared_task(name="api.send_invitation_email", acks_late=True)
 def send_invitation_email(invitation_id: str) -> None:
     try:
-        invitation = Invitation.objects.select_related("tenant").get(id=invitation_id)
+        invitation = Invitation.objects.select_related("tenant", "role").get(id=invitation_id)
     except Invitation.DoesNotExist:  # pragma: no cover - defensive
         logger.warning("Invitation %s not found for email dispatch", invitation_id)
         return
+    if invitation.status != Invitation.Status.PENDING:
+        logger.info("Skipping email for %s invitation %s", invitation.status, invitation_id)
+        return
 
     subject = f"You're invited to join {invitation.tenant.name} on IrshadOS"
     message = (
@@ -47,58 +71,87 @@ def send_invitation_email(invitation_id: str) -> None:
     logger.info("Invitation email queued for %s", invitation.email)
 
 
-@shared_task(name="api.export_audit_log")
+@shared_task(name="api.export_audit_log", acks_late=True)
 def export_audit_log(tenant_id: str) -> int:
-    try:
-        tenant = Tenant.objects.get(id=tenant_id)
-    except Tenant.DoesNotExist:  # pragma: no cover - defensive
+    slug = _tenant_slug(tenant_id)
+    if slug is None:  # pragma: no cover - defensive
         logger.warning("Tenant %s not found for audit export", tenant_id)
         return 0
 
     cutoff = timezone.now() - timedelta(days=30)
-    records = AuditLog.objects.filter(tenant=tenant, created_at__gte=cutoff).count()
-    logger.info("Prepared audit log export for %s (%s records)", tenant.slug, records)
+    records = AuditLog.objects.filter(tenant_id=tenant_id, created_at__gte=cutoff).count()
+    logger.info("Prepared audit log export for %s (%s records)", slug, records)
     return records
 
 
 @shared_task(name="api.restaurant.dispatch_kitchen_ticket")
 def dispatch_kitchen_ticket(ticket_id: str) -> None:
     try:
-        ticket = KitchenOrderTicket.objects.get(id=ticket_id)
+        ticket = (
+            KitchenOrderTicket.objects.select_related("tenant")
+            .annotate(line_count=Count("lines"))
+            .get(id=ticket_id)
+        )
     except KitchenOrderTicket.DoesNotExist:  # pragma: no cover - defensive
         logger.warning("Kitchen ticket %s not found for dispatch", ticket_id)
         return
     logger.info(
         "Dispatching kitchen ticket %s (%s items) for tenant %s",
         ticket.ticket_number,
-        ticket.lines.count(),
+        ticket.line_count,
         ticket.tenant.slug,
     )
 
 
-@shared_task(name="api.restaurant.compile_recipe_cost_report")
+@shared_task(name="api.sales.post_invoice")
+def post_sales_invoice(tenant_id: str, invoice_id: int) -> None:
+    with activate_tenant(tenant_id):
+        try:
+            invoice = SalesInvoice.objects.get(id=invoice_id)
+        except SalesInvoice.DoesNotExist:  # pragma: no cover - defensive
+            logger.warning("Sales invoice %s not found for posting", invoice_id)
+            return
+        SalesService.post_invoice(invoice)
+
+
+@shared_task(name="api.pos.finalize_sale")
+def finalize_pos_sale(tenant_id: str, sale_id: int, performed_by_id: str | None = None) -> None:
+    with activate_tenant(tenant_id):
+        try:
+            sale = POSSale.objects.get(id=sale_id)
+        except POSSale.DoesNotExist:  # pragma: no cover - defensive
+            logger.warning("POS sale %s not found for finalization", sale_id)
+            return
+        performer = User.objects.filter(id=performed_by_id).first() if performed_by_id else None
+        POSService.finalize_sale(sale, performed_by=performer)
+
+
+@shared_task(name="api.restaurant.compile_recipe_cost_report", acks_late=True, ignore_result=False)
 def compile_recipe_cost_report(tenant_id: str) -> dict:
-    try:
-        tenant = Tenant.objects.get(id=tenant_id)
-    except Tenant.DoesNotExist:  # pragma: no cover - defensive
+    slug = _tenant_slug(tenant_id)
+    if slug is None:  # pragma: no cover - defensive
         logger.warning("Tenant %s not found for recipe cost report", tenant_id)
         return {}
 
-    summary: dict[str, float] = {}
-    recipes = (
-        RecipeComponent.objects.filter(tenant=tenant)
-        .select_related("recipe__item", "ingredient")
+    costs = (
+        RecipeComponent.objects.filter(tenant_id=tenant_id)
+        .values("recipe__item__name")
+        .annotate(
+            total=Sum(
+                F("ingredient__cost_price") * F("quantity"),
+                output_field=DecimalField(max_digits=28, decimal_places=10),
+            )
+        )
         .order_by("recipe__item__name")
     )
-    for component in recipes:
-        item_name = component.recipe.item.name
-        base_cost = float(component.ingredient.cost_price or Decimal("0"))
-        summary.setdefault(item_name, 0.0)
-        summary[item_name] += base_cost * float(component.quantity)
+    summary: dict[str, float] = {
+        row["recipe__item__name"]: float(row["total"] or 0)
+        for row in costs.iterator(chunk_size=RECIPE_COST_CHUNK_SIZE)
+    }
 
     logger.info(
         "Compiled recipe cost report for %s (%s entries)",
-        tenant.slug,
+        slug,
         len(summary),
     )
     return summary
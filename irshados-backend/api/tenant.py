@@ -1,23 +1,26 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from typing import Optional
 from uuid import UUID
 
 from django.db import connection
 
-_current_tenant: Optional[str] = None
+_current_tenant: ContextVar[Optional[str]] = ContextVar("current_tenant", default=None)
+
+
+_MISSING = object()
 
 
 def _normalize_tenant_id(tenant: object | None) -> Optional[str]:
-    if tenant is None:
-        return None
+    if tenant is None or isinstance(tenant, str):
+        return tenant
     if isinstance(tenant, UUID):
         return str(tenant)
-    if hasattr(tenant, "id"):
-        return str(getattr(tenant, "id"))
-    if isinstance(tenant, str):
-        return tenant
+    tenant_id = getattr(tenant, "id", _MISSING)
+    if tenant_id is not _MISSING:
+        return str(tenant_id)
     raise TypeError("Unsupported tenant identifier type")
 
 
@@ -29,29 +32,26 @@ def _set_pg_tenant(tenant_id: Optional[str]) -> None:
         cursor.execute("SELECT set_config('app.tenant_id', %s, false)", [value])
 
 
-def set_current_tenant(tenant: object | None) -> Optional[str]:
-    global _current_tenant
+def set_current_tenant(tenant: object | None) -> Token:
     tenant_id = _normalize_tenant_id(tenant)
-    previous = _current_tenant
-    _current_tenant = tenant_id
+    token = _current_tenant.set(tenant_id)
     _set_pg_tenant(tenant_id)
-    return previous
+    return token
 
 
-def restore_previous_tenant(previous: Optional[str]) -> None:
-    global _current_tenant
-    _current_tenant = previous
-    _set_pg_tenant(previous)
+def restore_previous_tenant(token: Token) -> None:
+    _current_tenant.reset(token)
+    _set_pg_tenant(_current_tenant.get())
 
 
 @contextmanager
 def activate_tenant(tenant: object | None):
-    previous = set_current_tenant(tenant)
+    token = set_current_tenant(tenant)
     try:
         yield
     finally:
-        restore_previous_tenant(previous)
+        restore_previous_tenant(token)
 
 
 def get_current_tenant_id() -> Optional[str]:
-    return _current_tenant
+    return _current_tenant.get()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -8,6 +9,7 @@ from ..models import AuditLog, Invitation, Membership, Tenant, User
 from ..tenant import activate_tenant
 
 
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
 class AuthenticationTests(APITestCase):
     def setUp(self):
         self.signup_url = reverse("api:sign-up")
@@ -37,6 +39,24 @@ class AuthenticationTests(APITestCase):
             membership = Membership.objects.get(user=user, tenant=tenant)
         self.assertEqual(membership.role.slug, "owner")
 
+    def test_new_tenant_slug_is_suffixed_on_collision(self):
+        Tenant.objects.create(name="Irshad HQ", slug="irshad-hq")
+        payload = {
+            "userName": "Second Owner",
+            "email": "second@example.com",
+            "password": "SecurePass123",
+            "tenantMode": "new",
+            "tenantName": "Irshad HQ",
+        }
+        response = self.client.post(self.signup_url, data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Tenant.objects.filter(slug="irshad-hq-1").exists())
+
+        payload.update({"email": "third@example.com", "tenantSlug": "irshad-hq"})
+        response = self.client.post(self.signup_url, data=payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("tenantSlug", response.data)
+
     def test_existing_user_can_join_existing_tenant(self):
         tenant = Tenant.objects.create(name="Retail One", slug="retail-one")
         tenant.ensure_system_roles()
@@ -103,17 +123,22 @@ class AuthenticationTests(APITestCase):
             full_name="Retail Owner",
         )
         with activate_tenant(tenant):
-            Membership.objects.create(
-                tenant=tenant,
-                user=staff,
-                role=tenant.roles.get(slug="staff"),
-                status=Membership.Status.ACTIVE,
-            )
-            Membership.objects.create(
-                tenant=tenant,
-                user=owner,
-                role=tenant.roles.get(slug="owner"),
-                status=Membership.Status.ACTIVE,
+            roles = {role.slug: role for role in tenant.roles.filter(slug__in=["staff", "owner"])}
+            Membership.objects.bulk_create(
+                [
+                    Membership(
+                        tenant=tenant,
+                        user=staff,
+                        role=roles["staff"],
+                        status=Membership.Status.ACTIVE,
+                    ),
+                    Membership(
+                        tenant=tenant,
+                        user=owner,
+                        role=roles["owner"],
+                        status=Membership.Status.ACTIVE,
+                    ),
+                ]
             )
 
         sign_in_staff = self.client.post(
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from unittest import skipUnless
 
-import pytest
+from django.db import connection
+from django.test import TestCase
 from django.utils import timezone
 
 from api.models import (
     Customer,
     DeliveryNote,
     DeliveryNoteLine,
+    InventoryBalance,
+    InventoryLedgerEntry,
     POSShift,
     POSSale,
     POSSaleItem,
@@ -24,6 +28,7 @@ from api.models import (
     SalesInvoiceLine,
     SalesOrder,
     SalesOrderLine,
+    StockMovementLine,
     Supplier,
     Tenant,
     UnitOfMeasure,
@@ -38,387 +43,522 @@ from api.models import (
     KitchenDisplayEvent,
     QROrderingToken,
 )
-from api.services.inventory import InventoryService, StockMovementLineParams
+from api.serializers import (
+    INVENTORY_BALANCE_VALUES,
+    INVENTORY_LEDGER_VALUES,
+    InventoryBalanceSerializer,
+    POS_COPY_MIN_ROWS,
+    InventoryLedgerEntrySerializer,
+    POSSaleSerializer,
+    PurchaseOrderSerializer,
+    serialize_inventory_balances,
+    serialize_inventory_ledger_entries,
+)
+from api.services.inventory import MOVEMENT_COPY_MIN_ROWS, InventoryService, StockMovementLineParams
 from api.services.pos import POSService
 from api.services.purchasing import PurchasingService
 from api.services.sales import SalesService
 from api.services.restaurant import RestaurantService
 
 
-@pytest.fixture
-def tenant(db):
-    return Tenant.objects.create(name="TestCo", slug="testco", timezone="UTC")
-
-
-@pytest.fixture
-def base_objects(tenant):
-    uom = UnitOfMeasure.objects.create(tenant=tenant, code="EA", name="Each")
-    category = ProductCategory.objects.create(tenant=tenant, code="DEFAULT", name="Default")
-    product = Product.objects.create(
-        tenant=tenant,
-        code="PROD-001",
-        name="Test Widget",
-        category=category,
-        base_uom=uom,
-    )
-    variant = ProductVariant.objects.create(
-        tenant=tenant,
-        product=product,
-        sku="PROD-001",
-        name="Test Widget",
-        sales_uom=uom,
-        conversion_factor=Decimal("1"),
-    )
-    warehouse = Warehouse.objects.create(tenant=tenant, code="MAIN", name="Main Warehouse")
-    supplier = Supplier.objects.create(tenant=tenant, code="SUP", name="Supplier One")
-    customer = Customer.objects.create(tenant=tenant, code="CUST", name="Customer One")
-    return {
-        "uom": uom,
-        "variant": variant,
-        "warehouse": warehouse,
-        "supplier": supplier,
-        "customer": customer,
-    }
-
-
-@pytest.mark.django_db
-def test_inventory_weighted_average(tenant, base_objects):
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="purchase_receipt",
-        lines=[
-            StockMovementLineParams(
-                variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("10"),
-                unit_cost=Decimal("5"),
-            )
-        ],
-        reference_number="GRN-1",
-    )
-    balance = variant.inventory_balances.get(warehouse=warehouse)
-    assert balance.on_hand == Decimal("10")
-    assert balance.average_cost == Decimal("5")
-
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="purchase_receipt",
-        lines=[
-            StockMovementLineParams(
-                variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("10"),
-                unit_cost=Decimal("7"),
-            )
-        ],
-        reference_number="GRN-2",
-    )
-    balance.refresh_from_db()
-    assert balance.on_hand == Decimal("20")
-    assert balance.average_cost == Decimal("6")
-
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="sale_shipment",
-        lines=[
-            StockMovementLineParams(
-                variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("-4"),
-            )
-        ],
-        reference_number="SO-1",
-    )
-    balance.refresh_from_db()
-    assert balance.on_hand == Decimal("16")
-    assert balance.average_cost == Decimal("6")
-
-
-@pytest.mark.django_db
-def test_purchasing_receipt_updates_order_and_inventory(tenant, base_objects):
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-    supplier = base_objects["supplier"]
-
-    order = PurchaseOrder.objects.create(
-        tenant=tenant,
-        number="PO-1",
-        supplier=supplier,
-        order_date=timezone.now().date(),
-    )
-    line = PurchaseOrderLine.objects.create(
-        tenant=tenant,
-        order=order,
-        variant=variant,
-        ordered_quantity=Decimal("5"),
-        unit_price=Decimal("4"),
-    )
-    receipt = PurchaseReceipt.objects.create(
-        tenant=tenant,
-        order=order,
-        number="GRN-PO-1",
-        warehouse=warehouse,
-    )
-    PurchaseReceiptLine.objects.create(
-        tenant=tenant,
-        receipt=receipt,
-        order_line=line,
-        variant=variant,
-        quantity=Decimal("5"),
-        unit_cost=Decimal("4"),
-    )
-
-    PurchasingService.post_receipt(receipt)
-    line.refresh_from_db()
-    order.refresh_from_db()
-    assert line.received_quantity == Decimal("5")
-    assert order.status in {PurchaseOrder.Status.RECEIVING, PurchaseOrder.Status.RECEIVED}
-    balance = variant.inventory_balances.get(warehouse=warehouse)
-    assert balance.on_hand == Decimal("5")
-
-
-@pytest.mark.django_db
-def test_sales_delivery_and_invoice_flow(tenant, base_objects):
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-    supplier = base_objects["supplier"]
-    customer = base_objects["customer"]
-
-    # seed stock
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="purchase_receipt",
-        lines=[
-            StockMovementLineParams(
-                variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("8"),
-                unit_cost=Decimal("5"),
-            )
-        ],
-        reference_number="GRN-SEED",
-    )
-
-    order = SalesOrder.objects.create(
-        tenant=tenant,
-        number="SO-1",
-        customer=customer,
-        order_date=timezone.now().date(),
-    )
-    order_line = SalesOrderLine.objects.create(
-        tenant=tenant,
-        order=order,
-        variant=variant,
-        ordered_quantity=Decimal("3"),
-        unit_price=Decimal("9"),
-    )
-    delivery = DeliveryNote.objects.create(
-        tenant=tenant,
-        order=order,
-        number="DN-1",
-        warehouse=warehouse,
-    )
-    DeliveryNoteLine.objects.create(
-        tenant=tenant,
-        delivery=delivery,
-        order_line=order_line,
-        variant=variant,
-        quantity=Decimal("3"),
-    )
-    SalesService.post_delivery(delivery)
-    order_line.refresh_from_db()
-    assert order_line.delivered_quantity == Decimal("3")
-
-    invoice = SalesInvoice.objects.create(
-        tenant=tenant,
-        order=order,
-        number="INV-1",
-    )
-    SalesInvoiceLine.objects.create(
-        tenant=tenant,
-        invoice=invoice,
-        order_line=order_line,
-        description="Widget",
-        quantity=Decimal("3"),
-        unit_price=Decimal("9"),
-    )
-    SalesService.post_invoice(invoice)
-    invoice.refresh_from_db()
-    assert invoice.total_amount == Decimal("27")
-    order_line.refresh_from_db()
-    assert order_line.invoiced_quantity == Decimal("3")
-
-
-@pytest.mark.django_db
-def test_pos_sale_finalize(tenant, base_objects):
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="purchase_receipt",
-        lines=[
-            StockMovementLineParams(
+class ERPDomainTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant = Tenant.objects.create(name="TestCo", slug="testco", timezone="UTC")
+        cls.uom = UnitOfMeasure.objects.create(tenant=cls.tenant, code="EA", name="Each")
+        category = ProductCategory.objects.create(tenant=cls.tenant, code="DEFAULT", name="Default")
+        product = Product.objects.create(
+            tenant=cls.tenant,
+            code="PROD-001",
+            name="Test Widget",
+            category=category,
+            base_uom=cls.uom,
+        )
+        cls.variant = ProductVariant.objects.create(
+            tenant=cls.tenant,
+            product=product,
+            sku="PROD-001",
+            name="Test Widget",
+            sales_uom=cls.uom,
+            conversion_factor=Decimal("1"),
+        )
+        cls.warehouse = Warehouse.objects.create(tenant=cls.tenant, code="MAIN", name="Main Warehouse")
+        cls.supplier = Supplier.objects.create(tenant=cls.tenant, code="SUP", name="Supplier One")
+        cls.customer = Customer.objects.create(tenant=cls.tenant, code="CUST", name="Customer One")
+
+    def test_inventory_fast_lists_match_serializers(self):
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=self.variant,
+                    warehouse=self.warehouse,
+                    quantity=Decimal("4"),
+                    unit_cost=Decimal("2.5"),
+                )
+            ],
+            reference_number="GRN-FAST",
+        )
+        queryset = InventoryBalance.objects.filter(tenant=self.tenant)
+        expected = InventoryBalanceSerializer(
+            queryset.select_related("variant", "warehouse"), many=True
+        ).data
+        rows = serialize_inventory_balances(
+            queryset.values(*INVENTORY_BALANCE_VALUES.values())
+        )
+        self.assertEqual(rows, [dict(item) for item in expected])
+
+        ledger = InventoryLedgerEntry.objects.filter(tenant=self.tenant)
+        expected = InventoryLedgerEntrySerializer(
+            ledger.select_related("movement", "variant", "warehouse"), many=True
+        ).data
+        rows = serialize_inventory_ledger_entries(
+            ledger.values(*INVENTORY_LEDGER_VALUES.values())
+        )
+        self.assertEqual(rows, [dict(item) for item in expected])
+
+    def test_inventory_weighted_average(self):
+        variant = self.variant
+        warehouse = self.warehouse
+
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("10"),
+                    unit_cost=Decimal("5"),
+                )
+            ],
+            reference_number="GRN-1",
+        )
+        balance = variant.inventory_balances.get(warehouse=warehouse)
+        self.assertEqual(balance.on_hand, Decimal("10"))
+        self.assertEqual(balance.average_cost, Decimal("5"))
+
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("10"),
+                    unit_cost=Decimal("7"),
+                )
+            ],
+            reference_number="GRN-2",
+        )
+        balance.refresh_from_db()
+        self.assertEqual(balance.on_hand, Decimal("20"))
+        self.assertEqual(balance.average_cost, Decimal("6"))
+
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="sale_shipment",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("-4"),
+                )
+            ],
+            reference_number="SO-1",
+        )
+        balance.refresh_from_db()
+        self.assertEqual(balance.on_hand, Decimal("16"))
+        self.assertEqual(balance.average_cost, Decimal("6"))
+
+    @skipUnless(connection.vendor == "postgresql", "COPY inserts require PostgreSQL")
+    def test_large_movement_is_copied_with_linked_ledger_entries(self):
+        row_count = MOVEMENT_COPY_MIN_ROWS + 1
+        movement = InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=self.variant,
+                    warehouse=self.warehouse,
+                    quantity=Decimal("1"),
+                    unit_cost=Decimal("2"),
+                    metadata={"row": index},
+                )
+                for index in range(row_count)
+            ],
+            reference_number="GRN-COPY",
+        )
+
+        lines = StockMovementLine.objects.filter(movement=movement)
+        self.assertEqual(lines.count(), row_count)
+        self.assertFalse(lines.filter(created_at__isnull=True).exists())
+        entries = InventoryLedgerEntry.objects.filter(movement=movement)
+        self.assertEqual(entries.count(), row_count)
+        self.assertEqual(
+            set(entries.values_list("line_id", flat=True)),
+            set(lines.values_list("pk", flat=True)),
+        )
+        # Each ledger entry points at the line built from the same movement row.
+        for running_quantity, metadata in entries.values_list("running_quantity", "line__metadata"):
+            self.assertEqual(running_quantity, metadata["row"] + 1)
+
+        balance = self.variant.inventory_balances.get(warehouse=self.warehouse)
+        self.assertEqual(balance.on_hand, Decimal(row_count))
+        self.assertEqual(balance.average_cost, Decimal("2"))
+
+    def test_inventory_skips_zero_quantity_lines(self):
+        variant = self.variant
+        warehouse = self.warehouse
+
+        movement = InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="adjustment",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("0.0004"),
+                    unit_cost=Decimal("5"),
+                )
+            ],
+            reference_number="ADJ-1",
+        )
+        self.assertFalse(movement.lines.exists())
+        self.assertFalse(InventoryLedgerEntry.objects.filter(movement=movement).exists())
+        self.assertFalse(InventoryBalance.objects.filter(variant=variant, warehouse=warehouse).exists())
+
+    def test_purchasing_receipt_updates_order_and_inventory(self):
+        variant = self.variant
+        warehouse = self.warehouse
+        supplier = self.supplier
+
+        order = PurchaseOrder.objects.create(
+            tenant=self.tenant,
+            number="PO-1",
+            supplier=supplier,
+            order_date=timezone.now().date(),
+        )
+        line = PurchaseOrderLine.objects.create(
+            tenant=self.tenant,
+            order=order,
+            variant=variant,
+            ordered_quantity=Decimal("5"),
+            unit_price=Decimal("4"),
+        )
+        receipt = PurchaseReceipt.objects.create(
+            tenant=self.tenant,
+            order=order,
+            number="GRN-PO-1",
+            warehouse=warehouse,
+        )
+        PurchaseReceiptLine.objects.create(
+            tenant=self.tenant,
+            receipt=receipt,
+            order_line=line,
+            variant=variant,
+            quantity=Decimal("5"),
+            unit_cost=Decimal("4"),
+        )
+
+        PurchasingService.post_receipt(receipt)
+        line.refresh_from_db()
+        order.refresh_from_db()
+        self.assertEqual(line.received_quantity, Decimal("5"))
+        self.assertIn(order.status, {PurchaseOrder.Status.RECEIVING, PurchaseOrder.Status.RECEIVED})
+        balance = variant.inventory_balances.get(warehouse=warehouse)
+        self.assertEqual(balance.on_hand, Decimal("5"))
+
+    def test_purchase_order_update_matches_repeated_variant_lines(self):
+        variant = self.variant
+        order = PurchaseOrder.objects.create(
+            tenant=self.tenant,
+            number="PO-DUP",
+            supplier=self.supplier,
+            order_date=timezone.now().date(),
+        )
+        first, second = (
+            PurchaseOrderLine.objects.create(
+                tenant=self.tenant,
+                order=order,
                 variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("6"),
-                unit_cost=Decimal("4"),
+                ordered_quantity=quantity,
+                unit_price=Decimal("4"),
             )
-        ],
-        reference_number="GRN-POS",
-    )
-
-    shift = POSShift.objects.create(tenant=tenant, register_code="REG-1")
-    sale = POSSale.objects.create(
-        tenant=tenant,
-        shift=shift,
-        warehouse=warehouse,
-        reference="POS-1",
-    )
-    POSSaleItem.objects.create(
-        tenant=tenant,
-        sale=sale,
-        variant=variant,
-        quantity=Decimal("2"),
-        unit_price=Decimal("8"),
-    )
-    POSSalePayment.objects.create(
-        tenant=tenant,
-        sale=sale,
-        method="cash",
-        amount=Decimal("16"),
-    )
-
-    POSService.recalculate_sale_totals(sale)
-    POSService.finalize_sale(sale)
-    sale.refresh_from_db()
-    assert sale.status == POSSale.Status.PAID
-    assert sale.stock_movement is not None
-    balance = variant.inventory_balances.get(warehouse=warehouse)
-    assert balance.on_hand == Decimal("4")
-
-
-
-
-@pytest.mark.django_db
-def test_recipe_consumption_reduces_balance(tenant, base_objects):
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-    uom = base_objects["uom"]
-
-    InventoryService.record_movement(
-        tenant=tenant,
-        movement_type="purchase_receipt",
-        lines=[
-            StockMovementLineParams(
-                variant=variant,
-                warehouse=warehouse,
-                quantity=Decimal("10"),
-                unit_cost=Decimal("3"),
-            )
-        ],
-        reference_number="GRN-RECIPE",
-    )
-
-    menu = Menu.objects.create(tenant=tenant, name="Dinner")
-    section = MenuSection.objects.create(tenant=tenant, menu=menu, name="Entrees")
-    item = MenuItem.objects.create(
-        tenant=tenant,
-        section=section,
-        name="Pasta",
-        base_price=Decimal("12"),
-    )
-    recipe = Recipe.objects.create(
-        tenant=tenant,
-        item=item,
-        instructions="Boil and serve",
-        yield_quantity=Decimal("1"),
-        yield_uom=uom,
-    )
-    RecipeComponent.objects.create(
-        tenant=tenant,
-        recipe=recipe,
-        ingredient=variant,
-        quantity=Decimal("0.5"),
-        uom=uom,
-    )
-
-    ticket = KitchenOrderTicket.objects.create(
-        tenant=tenant,
-        ticket_number="KOT-1",
-        table_number="T1",
-        source=KitchenOrderTicket.Source.DINE_IN,
-    )
-
-    RestaurantService.create_ticket(
-        tenant=tenant,
-        ticket=ticket,
-        lines=[{"item": item, "quantity": Decimal("2") }],
-    )
-
-    balance = variant.inventory_balances.get(warehouse=warehouse)
-    assert balance.on_hand == Decimal("9")  # consumed 1 unit total
-
-
-@pytest.mark.django_db
-def test_kds_bump_creates_event(tenant, base_objects):
-    uom = base_objects["uom"]
-    variant = base_objects["variant"]
-    warehouse = base_objects["warehouse"]
-
-    menu = Menu.objects.create(tenant=tenant, name="Lunch")
-    section = MenuSection.objects.create(tenant=tenant, menu=menu, name="Main")
-    item = MenuItem.objects.create(
-        tenant=tenant,
-        section=section,
-        name="Burger",
-        base_price=Decimal("9"),
-    )
-    recipe = Recipe.objects.create(tenant=tenant, item=item, yield_quantity=Decimal("1"), yield_uom=uom)
-    RecipeComponent.objects.create(
-        tenant=tenant,
-        recipe=recipe,
-        ingredient=variant,
-        quantity=Decimal("1"),
-        uom=uom,
-    )
-
-    ticket = KitchenOrderTicket.objects.create(
-        tenant=tenant,
-        ticket_number="KOT-2",
-        source=KitchenOrderTicket.Source.TAKEAWAY,
-    )
-    RestaurantService.create_ticket(
-        tenant=tenant,
-        ticket=ticket,
-        lines=[{"item": item, "quantity": Decimal("1") }],
-    )
-
-    event = RestaurantService.publish_kds_event(
-        tenant=tenant,
-        ticket=ticket,
-        action=KitchenDisplayEvent.Action.BUMP,
-        actor="chef",
-    )
-    assert event.action == KitchenDisplayEvent.Action.BUMP
-    assert event.actor == "chef"
-
-
-@pytest.mark.django_db
-def test_qr_token_validation(tenant):
-    menu = Menu.objects.create(tenant=tenant, name="Snacks")
-    token = QROrderingToken.objects.create(
-        tenant=tenant,
-        token="abc123",
-        menu=menu,
-        table_number="T5",
-        expires_at=timezone.now() + timezone.timedelta(hours=1),
-    )
-    assert RestaurantService.verify_qr_token(token) is True
-    token.is_active = False
-    token.save(update_fields=["is_active"])
-    assert RestaurantService.verify_qr_token(token) is False
-
+            for quantity in (Decimal("5"), Decimal("3"))
+        )
+
+        PurchaseOrderSerializer(context={"tenant": self.tenant}).update(
+            order,
+            {"line_items": [{"variant": variant.pk, "ordered_quantity": Decimal("2"), "unit_price": Decimal("4")}]},
+        )
+
+        lines = list(order.lines.all())
+        self.assertEqual([line.pk for line in lines], [first.pk])
+        self.assertEqual(lines[0].ordered_quantity, Decimal("2"))
+        self.assertFalse(PurchaseOrderLine.objects.filter(pk=second.pk).exists())
+        order.refresh_from_db()
+        self.assertEqual(order.subtotal, Decimal("8.00"))
+
+    def test_sales_delivery_and_invoice_flow(self):
+        variant = self.variant
+        warehouse = self.warehouse
+        supplier = self.supplier
+        customer = self.customer
+
+        # seed stock
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("8"),
+                    unit_cost=Decimal("5"),
+                )
+            ],
+            reference_number="GRN-SEED",
+        )
+
+        order = SalesOrder.objects.create(
+            tenant=self.tenant,
+            number="SO-1",
+            customer=customer,
+            order_date=timezone.now().date(),
+        )
+        order_line = SalesOrderLine.objects.create(
+            tenant=self.tenant,
+            order=order,
+            variant=variant,
+            ordered_quantity=Decimal("3"),
+            unit_price=Decimal("9"),
+        )
+        delivery = DeliveryNote.objects.create(
+            tenant=self.tenant,
+            order=order,
+            number="DN-1",
+            warehouse=warehouse,
+        )
+        DeliveryNoteLine.objects.create(
+            tenant=self.tenant,
+            delivery=delivery,
+            order_line=order_line,
+            variant=variant,
+            quantity=Decimal("3"),
+        )
+        SalesService.post_delivery(delivery)
+        order_line.refresh_from_db()
+        self.assertEqual(order_line.delivered_quantity, Decimal("3"))
+
+        invoice = SalesInvoice.objects.create(
+            tenant=self.tenant,
+            order=order,
+            number="INV-1",
+        )
+        SalesInvoiceLine.objects.create(
+            tenant=self.tenant,
+            invoice=invoice,
+            order_line=order_line,
+            description="Widget",
+            quantity=Decimal("3"),
+            unit_price=Decimal("9"),
+        )
+        SalesService.post_invoice(invoice)
+        invoice.refresh_from_db()
+        self.assertEqual(invoice.total_amount, Decimal("27"))
+        order_line.refresh_from_db()
+        self.assertEqual(order_line.invoiced_quantity, Decimal("3"))
+
+    def test_pos_sale_finalize(self):
+        variant = self.variant
+        warehouse = self.warehouse
+
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("6"),
+                    unit_cost=Decimal("4"),
+                )
+            ],
+            reference_number="GRN-POS",
+        )
+
+        shift = POSShift.objects.create(tenant=self.tenant, register_code="REG-1")
+        sale = POSSale.objects.create(
+            tenant=self.tenant,
+            shift=shift,
+            warehouse=warehouse,
+            reference="POS-1",
+        )
+        POSSaleItem.objects.create(
+            tenant=self.tenant,
+            sale=sale,
+            variant=variant,
+            quantity=Decimal("2"),
+            unit_price=Decimal("8"),
+        )
+        POSSalePayment.objects.create(
+            tenant=self.tenant,
+            sale=sale,
+            method="cash",
+            amount=Decimal("16"),
+        )
+
+        POSService.recalculate_sale_totals(sale)
+        POSService.finalize_sale(sale)
+        sale.refresh_from_db()
+        self.assertEqual(sale.status, POSSale.Status.PAID)
+        self.assertIsNotNone(sale.stock_movement)
+        balance = variant.inventory_balances.get(warehouse=warehouse)
+        self.assertEqual(balance.on_hand, Decimal("4"))
+
+    @skipUnless(connection.vendor == "postgresql", "COPY inserts require PostgreSQL")
+    def test_large_pos_sale_is_copied_and_totalled(self):
+        row_count = POS_COPY_MIN_ROWS + 1
+        shift = POSShift.objects.create(tenant=self.tenant, register_code="REG-COPY")
+        serializer = POSSaleSerializer(
+            data={
+                "shift": shift.pk,
+                "warehouse": self.warehouse.pk,
+                "reference": "POS-COPY",
+                "line_items": [
+                    {"variant": self.variant.pk, "quantity": "1", "unit_price": "2", "metadata": {"row": index}}
+                    for index in range(row_count)
+                ],
+                "payment_items": [{"method": "cash", "amount": "2"} for _ in range(row_count)],
+            },
+            context={"tenant": self.tenant},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        sale = serializer.save()
+
+        total = Decimal(2 * row_count)
+        self.assertEqual(sale.subtotal, total)
+        self.assertEqual(sale.paid_amount, total)
+        self.assertEqual(POSSaleItem.objects.filter(sale=sale, line_total=Decimal("2")).count(), row_count)
+        self.assertEqual(len(serializer.data["items"]), row_count)
+        self.assertEqual(len(serializer.data["payments"]), row_count)
+        self.assertEqual(
+            sorted(item["metadata"]["row"] for item in serializer.data["items"]),
+            list(range(row_count)),
+        )
+
+    def test_recipe_consumption_reduces_balance(self):
+        variant = self.variant
+        warehouse = self.warehouse
+        uom = self.uom
+
+        InventoryService.record_movement(
+            tenant=self.tenant,
+            movement_type="purchase_receipt",
+            lines=[
+                StockMovementLineParams(
+                    variant=variant,
+                    warehouse=warehouse,
+                    quantity=Decimal("10"),
+                    unit_cost=Decimal("3"),
+                )
+            ],
+            reference_number="GRN-RECIPE",
+        )
+
+        menu = Menu.objects.create(tenant=self.tenant, name="Dinner")
+        section = MenuSection.objects.create(tenant=self.tenant, menu=menu, name="Entrees")
+        item = MenuItem.objects.create(
+            tenant=self.tenant,
+            section=section,
+            name="Pasta",
+            base_price=Decimal("12"),
+        )
+        recipe = Recipe.objects.create(
+            tenant=self.tenant,
+            item=item,
+            instructions="Boil and serve",
+            yield_quantity=Decimal("1"),
+            yield_uom=uom,
+        )
+        RecipeComponent.objects.create(
+            tenant=self.tenant,
+            recipe=recipe,
+            ingredient=variant,
+            quantity=Decimal("0.5"),
+            uom=uom,
+        )
+
+        ticket = KitchenOrderTicket.objects.create(
+            tenant=self.tenant,
+            ticket_number="KOT-1",
+            table_number="T1",
+            source=KitchenOrderTicket.Source.DINE_IN,
+        )
+
+        RestaurantService.create_ticket(
+            tenant=self.tenant,
+            ticket=ticket,
+            lines=[{"item": item, "quantity": Decimal("2") }],
+        )
+
+        balance = variant.inventory_balances.get(warehouse=warehouse)
+        self.assertEqual(balance.on_hand, Decimal("9"))  # consumed 1 unit total
+
+    def test_kds_bump_creates_event(self):
+        uom = self.uom
+        variant = self.variant
+        warehouse = self.warehouse
+
+        menu = Menu.objects.create(tenant=self.tenant, name="Lunch")
+        section = MenuSection.objects.create(tenant=self.tenant, menu=menu, name="Main")
+        item = MenuItem.objects.create(
+            tenant=self.tenant,
+            section=section,
+            name="Burger",
+            base_price=Decimal("9"),
+        )
+        recipe = Recipe.objects.create(tenant=self.tenant, item=item, yield_quantity=Decimal("1"), yield_uom=uom)
+        RecipeComponent.objects.create(
+            tenant=self.tenant,
+            recipe=recipe,
+            ingredient=variant,
+            quantity=Decimal("1"),
+            uom=uom,
+        )
+
+        ticket = KitchenOrderTicket.objects.create(
+            tenant=self.tenant,
+            ticket_number="KOT-2",
+            source=KitchenOrderTicket.Source.TAKEAWAY,
+        )
+        RestaurantService.create_ticket(
+            tenant=self.tenant,
+            ticket=ticket,
+            lines=[{"item": item, "quantity": Decimal("1") }],
+        )
+
+        event = RestaurantService.publish_kds_event(
+            tenant=self.tenant,
+            ticket=ticket,
+            action=KitchenDisplayEvent.Action.BUMP,
+            actor="chef",
+        )
+        self.assertEqual(event.action, KitchenDisplayEvent.Action.BUMP)
+        self.assertEqual(event.actor, "chef")
+
+    def test_qr_token_validation(self):
+        menu = Menu.objects.create(tenant=self.tenant, name="Snacks")
+        token = QROrderingToken.objects.create(
+            tenant=self.tenant,
+            token="abc123",
+            menu=menu,
+            table_number="T5",
+            expires_at=timezone.now() + timezone.timedelta(hours=1),
+        )
+        self.assertTrue(RestaurantService.verify_qr_token(token))
+        token.is_active = False
+        token.save(update_fields=["is_active"])
+        self.assertFalse(RestaurantService.verify_qr_token(token))
@@ -1,57 +1,55 @@
 from __future__ import annotations
 
+from unittest import skipUnless
+
 from django.db import connection
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from ..models import Membership, Tenant, User
 from ..tenant import activate_tenant
+from ..views import _issue_tokens
 
 
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
 class TenancyIsolationTests(APITestCase):
-    def setUp(self):
-        self.signin_url = reverse("api:sign-in")
-        self.current_tenant_url = reverse("api:current-tenant")
-        self.tenant_a = Tenant.objects.create(name="Alpha Retail", slug="alpha-retail")
-        self.tenant_a.ensure_system_roles()
-        self.tenant_b = Tenant.objects.create(name="Beta Retail", slug="beta-retail")
-        self.tenant_b.ensure_system_roles()
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant_a = Tenant.objects.create(name="Alpha Retail", slug="alpha-retail")
+        cls.tenant_a.ensure_system_roles()
+        cls.tenant_b = Tenant.objects.create(name="Beta Retail", slug="beta-retail")
+        cls.tenant_b.ensure_system_roles()
 
-        self.user_a = User.objects.create_user(
+        cls.user_a = User.objects.create_user(
             email="alpha@example.com", password="StrongPass123", full_name="Alpha Admin"
         )
-        self.user_b = User.objects.create_user(
+        cls.user_b = User.objects.create_user(
             email="beta@example.com", password="StrongPass123", full_name="Beta Admin"
         )
 
-        with activate_tenant(self.tenant_a):
-            Membership.objects.create(
-                tenant=self.tenant_a,
-                user=self.user_a,
-                role=self.tenant_a.roles.get(slug="owner"),
+        with activate_tenant(cls.tenant_a):
+            membership_a = Membership.objects.create(
+                tenant=cls.tenant_a,
+                user=cls.user_a,
+                role=cls.tenant_a.roles.get(slug="owner"),
                 status=Membership.Status.ACTIVE,
             )
-        with activate_tenant(self.tenant_b):
+        with activate_tenant(cls.tenant_b):
             Membership.objects.create(
-                tenant=self.tenant_b,
-                user=self.user_b,
-                role=self.tenant_b.roles.get(slug="owner"),
+                tenant=cls.tenant_b,
+                user=cls.user_b,
+                role=cls.tenant_b.roles.get(slug="owner"),
                 status=Membership.Status.ACTIVE,
             )
+        cls.token_a = _issue_tokens(cls.user_a, membership_a)["accessToken"]
 
-    def _access_token(self, email: str, password: str, tenant_slug: str) -> str:
-        response = self.client.post(
-            self.signin_url,
-            data={"email": email, "password": password, "tenantSlug": tenant_slug},
-            format="json",
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        return response.data["accessToken"]
+    def setUp(self):
+        self.current_tenant_url = reverse("api:current-tenant")
 
+    @skipUnless(connection.vendor == "postgresql", "Row-level security policies require PostgreSQL")
     def test_rls_blocks_cross_tenant_reads(self):
-        if connection.vendor != "postgresql":
-            self.skipTest("Row-level security policies require PostgreSQL")
         with activate_tenant(self.tenant_a):
             self.assertEqual(Membership.objects.count(), 1)
             self.assertTrue(
@@ -68,7 +66,7 @@ class TenancyIsolationTests(APITestCase):
             self.assertEqual(Membership.objects.count(), 0)
 
     def test_current_tenant_endpoint_requires_header(self):
-        token = self._access_token("alpha@example.com", "StrongPass123", self.tenant_a.slug)
+        token = self.token_a
 
         # Missing header should raise validation error
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
@@ -1,5 +1,5 @@
 from django.urls import include, path
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .views import (
     CustomerViewSet,
@@ -54,7 +54,7 @@ from .views import (
 
 app_name = "api"
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register("masters/uoms", UnitOfMeasureViewSet, basename="uom")
 router.register("masters/categories", ProductCategoryViewSet, basename="product-category")
 router.register("masters/products", ProductViewSet, basename="product")
@@ -11,6 +11,15 @@ from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 
 from .permissions import HasTenantPermissions, require_tenant_permissions
 from .serializers import (
+    INVENTORY_BALANCE_VALUES,
+    INVENTORY_LEDGER_VALUES,
+    KITCHEN_ORDER_TICKET_NESTED_VALUES,
+    KITCHEN_ORDER_TICKET_VALUES,
+    MENU_ITEM_VALUES,
+    POS_SALE_NESTED_VALUES,
+    POS_SALE_VALUES,
+    SALES_INVOICE_NESTED_VALUES,
+    SALES_INVOICE_VALUES,
     CustomerSerializer,
     InventoryBalanceSerializer,
     InventoryLedgerEntrySerializer,
@@ -56,6 +65,9 @@ from .serializers import (
     UserSerializer,
     WarehouseBinSerializer,
     WarehouseSerializer,
+    serialize_inventory_balances,
+    serialize_inventory_ledger_entries,
+    serialize_nested_value_rows,
 )
 from .tenant import activate_tenant
 from .models import (
@@ -315,6 +327,8 @@ class TenantModelViewSet(viewsets.ModelViewSet):
     view_permissions: tuple[str, ...] = ()
     edit_permissions: tuple[str, ...] = ()
     delete_permissions: tuple[str, ...] | None = None
+    list_values: dict[str, str] | None = None
+    list_nested_values: dict = {}
 
     def get_permissions(self):
         action = getattr(self, "action", None)
@@ -338,7 +352,32 @@ class TenantModelViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
         if tenant is None:
             return queryset.none()
-        return queryset.filter(tenant=tenant)
+        queryset = queryset.filter(tenant=tenant)
+        serializer_class = self.get_serializer_class()
+        for_list = getattr(self, "action", None) == "list"
+        setup_eager_loading = getattr(serializer_class, "setup_eager_loading", None)
+        if setup_eager_loading is not None:
+            queryset = setup_eager_loading(queryset, for_list=for_list)
+        deferred = getattr(serializer_class, "list_deferred_fields", ())
+        if for_list and deferred:
+            queryset = queryset.defer(*deferred)
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        if self.list_values is None or request.query_params.get("expand") == "full":
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        rows = queryset.values(*self.list_values.values())
+        page = self.paginate_queryset(rows)
+        data = serialize_nested_value_rows(
+            self.get_serializer_class(),
+            self.list_values,
+            rows if page is None else page,
+            self.list_nested_values,
+        )
+        if page is not None:
+            return self.get_paginated_response(data)
+        return response.Response(data)
 
     def filter_queryset(self, queryset):
         queryset = super().filter_queryset(queryset)
@@ -547,6 +586,14 @@ class InventoryBalanceViewSet(TenantModelViewSet):
     view_permissions = ("inventory.report",)
     http_method_names = ["get", "head", "options"]
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*INVENTORY_BALANCE_VALUES.values())
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_inventory_balances(page))
+        return response.Response(serialize_inventory_balances(rows))
+
     def apply_filters(self, queryset):
         params = self.request.query_params
         variant = params.get("variant")
@@ -567,11 +614,7 @@ class InventoryBalanceViewSet(TenantModelViewSet):
 
 
 class StockMovementViewSet(TenantModelViewSet):
-    queryset = (
-        StockMovement.objects.select_related("performed_by")
-        .prefetch_related("lines__variant", "lines__warehouse", "ledger_entries")
-        .all()
-    )
+    queryset = StockMovement.objects.all()
     serializer_class = StockMovementSerializer
     view_permissions = ("inventory.view",)
     edit_permissions = ("inventory.manage",)
@@ -602,6 +645,17 @@ class StockMovementViewSet(TenantModelViewSet):
             queryset = queryset.filter(performed_at__date__lte=performed_to)
         return queryset
 
+    @action(detail=True, methods=["get"], url_path="ledger-entries")
+    def ledger_entries(self, request, pk=None):
+        movement = self.get_object()
+        rows = InventoryLedgerEntry.objects.filter(
+            tenant=movement.tenant, movement=movement
+        ).values(*INVENTORY_LEDGER_VALUES.values())
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_inventory_ledger_entries(page))
+        return response.Response(serialize_inventory_ledger_entries(rows))
+
 
 class InventoryLedgerEntryViewSet(TenantModelViewSet):
     queryset = InventoryLedgerEntry.objects.select_related(
@@ -611,6 +665,14 @@ class InventoryLedgerEntryViewSet(TenantModelViewSet):
     view_permissions = ("inventory.report",)
     http_method_names = ["get", "head", "options"]
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.values(*INVENTORY_LEDGER_VALUES.values())
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serialize_inventory_ledger_entries(page))
+        return response.Response(serialize_inventory_ledger_entries(rows))
+
     def apply_filters(self, queryset):
         params = self.request.query_params
         variant = params.get("variant")
@@ -661,7 +723,7 @@ class SupplierViewSet(TenantModelViewSet):
 
 
 class PurchaseOrderViewSet(TenantModelViewSet):
-    queryset = PurchaseOrder.objects.select_related("supplier", "created_by").prefetch_related("lines__variant")
+    queryset = PurchaseOrder.objects.all()
     serializer_class = PurchaseOrderSerializer
     view_permissions = ("purchasing.view",)
     edit_permissions = ("purchasing.manage",)
@@ -716,9 +778,7 @@ class PurchaseOrderViewSet(TenantModelViewSet):
 
 
 class PurchaseReceiptViewSet(TenantModelViewSet):
-    queryset = PurchaseReceipt.objects.select_related("order", "warehouse", "stock_movement").prefetch_related(
-        "lines__variant"
-    )
+    queryset = PurchaseReceipt.objects.all()
     serializer_class = PurchaseReceiptSerializer
     view_permissions = ("purchasing.view",)
     edit_permissions = ("purchasing.manage",)
@@ -829,7 +889,7 @@ class PurchasePaymentViewSet(TenantModelViewSet):
 
 
 class SalesOrderViewSet(TenantModelViewSet):
-    queryset = SalesOrder.objects.select_related("customer", "created_by").prefetch_related("lines__variant")
+    queryset = SalesOrder.objects.all()
     serializer_class = SalesOrderSerializer
     view_permissions = ("sales.view",)
     edit_permissions = ("sales.manage",)
@@ -879,9 +939,7 @@ class SalesOrderViewSet(TenantModelViewSet):
 
 
 class DeliveryNoteViewSet(TenantModelViewSet):
-    queryset = DeliveryNote.objects.select_related("order", "warehouse", "stock_movement").prefetch_related(
-        "lines__variant"
-    )
+    queryset = DeliveryNote.objects.all()
     serializer_class = DeliveryNoteSerializer
     view_permissions = ("sales.view",)
     edit_permissions = ("sales.manage",)
@@ -920,8 +978,10 @@ class DeliveryNoteViewSet(TenantModelViewSet):
 
 
 class SalesInvoiceViewSet(TenantModelViewSet):
-    queryset = SalesInvoice.objects.select_related("order").prefetch_related("lines")
+    queryset = SalesInvoice.objects.all()
     serializer_class = SalesInvoiceSerializer
+    list_values = SALES_INVOICE_VALUES
+    list_nested_values = SALES_INVOICE_NESTED_VALUES
     view_permissions = ("sales.view",)
     edit_permissions = ("sales.manage",)
 
@@ -1053,6 +1113,7 @@ class MenuSectionViewSet(TenantModelViewSet):
 class MenuItemViewSet(TenantModelViewSet):
     queryset = MenuItem.objects.select_related("section", "section__menu", "variant").all()
     serializer_class = MenuItemSerializer
+    list_values = MENU_ITEM_VALUES
     view_permissions = ("restaurant.view",)
     edit_permissions = ("restaurant.manage",)
 
@@ -1109,7 +1170,7 @@ class MenuModifierOptionViewSet(TenantModelViewSet):
 
 
 class RecipeViewSet(TenantModelViewSet):
-    queryset = Recipe.objects.select_related("item").prefetch_related("components").all()
+    queryset = Recipe.objects.all()
     serializer_class = RecipeSerializer
     view_permissions = ("restaurant.view",)
     edit_permissions = ("restaurant.manage",)
@@ -1154,8 +1215,10 @@ class KitchenDisplayEventViewSet(TenantModelViewSet):
 
 
 class KitchenOrderTicketViewSet(TenantModelViewSet):
-    queryset = KitchenOrderTicket.objects.prefetch_related("lines__item", "kds_events").all()
+    queryset = KitchenOrderTicket.objects.all()
     serializer_class = KitchenOrderTicketSerializer
+    list_values = KITCHEN_ORDER_TICKET_VALUES
+    list_nested_values = KITCHEN_ORDER_TICKET_NESTED_VALUES
     view_permissions = ("restaurant.view",)
     edit_permissions = ("restaurant.manage",)
 
@@ -1266,12 +1329,10 @@ class POSShiftViewSet(TenantModelViewSet):
 
 
 class POSSaleViewSet(TenantModelViewSet):
-    queryset = (
-        POSSale.objects.select_related("shift", "customer", "warehouse")
-        .prefetch_related("items__variant", "payments")
-        .all()
-    )
+    queryset = POSSale.objects.all()
     serializer_class = POSSaleSerializer
+    list_values = POS_SALE_VALUES
+    list_nested_values = POS_SALE_NESTED_VALUES
     view_permissions = ("pos.view",)
     edit_permissions = ("pos.manage",)
 
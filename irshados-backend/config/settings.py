@@ -155,7 +155,18 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_TASK_IGNORE_RESULT = True
 CELERY_TASK_DEFAULT_QUEUE = os.getenv("CELERY_TASK_DEFAULT_QUEUE", "irshados.default")
+CELERY_TASK_EMAIL_QUEUE = os.getenv("CELERY_TASK_EMAIL_QUEUE", "irshados.email")
+CELERY_TASK_REPORTS_QUEUE = os.getenv("CELERY_TASK_REPORTS_QUEUE", "irshados.reports")
+# Keep short, latency-sensitive mail off the queue that serves long report scans.
+CELERY_TASK_ROUTES = {
+    "api.send_invitation_email": {"queue": CELERY_TASK_EMAIL_QUEUE},
+    "api.export_audit_log": {"queue": CELERY_TASK_REPORTS_QUEUE},
+    "api.restaurant.compile_recipe_cost_report": {"queue": CELERY_TASK_REPORTS_QUEUE},
+}
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv("CELERY_WORKER_PREFETCH_MULTIPLIER", "1"))
+CELERY_WORKER_MAX_TASKS_PER_CHILD = int(os.getenv("CELERY_WORKER_MAX_TASKS_PER_CHILD", "100"))
 CELERY_BEAT_SCHEDULE = {}
 
 AUDIT_LOG_SENSITIVE_FIELDS = {